@@ -0,0 +1,134 @@
+"""Benchmark the per-class attribute updaters on a 1,000 module home.
+
+Compares AttributeUpdater.apply with the former rebuild of the instance
+dict, and times a full Home.update.
+
+    python benchmarks/attribute_updater.py
+"""
+from __future__ import annotations
+
+# Import asyncio before the integration directory shadows the stdlib select
+import asyncio
+from pathlib import Path
+import sys
+import time
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "custom_components" / "netatmo"))
+
+from pyatmo.home import Home  # noqa: E402
+from pyatmo.modules.base_class import UPDATERS, Place  # noqa: E402
+from pyatmo.modules.device_types import DeviceType  # noqa: E402
+
+MODULES = 1000
+RUNS = 200
+TYPES = ["NLP", "NLF", "NLV", "NLPM", "NATherm1", "NRV", "NLFN", "NLG"]
+
+LEGACY_ATTRIBUTES_MAP = {
+    "entity_id": lambda x, y: x.get("id", y),
+    "modules": lambda x, y: x.get("modules_bridged", y),
+    "device_type": lambda x, y: DeviceType(x.get("type", y)),
+    "reachable": lambda x, _: x.get("reachable", False),
+    "monitoring": lambda x, _: x.get("monitoring", False) == "on",
+    "battery_level": lambda x, y: x.get("battery_vp", x.get("battery_level")),
+    "place": lambda x, _: Place(x.get("place")),
+}
+
+
+def legacy_update_attributes(entity: Any, raw_data: dict) -> None:
+    """Rebuild the instance dict the way _update_attributes used to."""
+    old = entity.__dict__
+    entity.__dict__ = {
+        key: LEGACY_ATTRIBUTES_MAP.get(key, lambda x, y, k=key: x.get(k, y))(
+            raw_data, val
+        )
+        for key, val in old.items()
+    }
+    changes = old.get("changes", {})
+    changes.update(
+        {
+            key: (old.get(key), val)
+            for key, val in entity.__dict__.items()
+            if key != "changes" and old.get(key) != val
+        }
+    )
+    entity.changes = changes
+
+
+class LegacyEntity:
+    """Entity keeping its attributes in a plain instance dict."""
+
+    def __init__(self, attributes: dict[str, Any]) -> None:
+        self.__dict__.update(attributes)
+
+
+def payload(step: int) -> list[dict]:
+    return [
+        {
+            "id": f"00:00:{i:04x}",
+            "type": TYPES[i % len(TYPES)],
+            "reachable": True,
+            "on": bool((i + step) % 2),
+            "power": i + step,
+            "firmware_revision": 42,
+            "rf_strength": 70,
+            "battery_state": "high",
+            "brightness": 50,
+        }
+        for i in range(MODULES)
+    ]
+
+
+def timed(func, *args) -> float:
+    start = time.perf_counter()
+    for run in range(RUNS):
+        func(run, *args)
+    return (time.perf_counter() - start) / RUNS * 1000
+
+
+async def main() -> None:
+    home = Home(
+        None,
+        {
+            "id": "home",
+            "name": "Home",
+            "modules": [
+                {"id": f"00:00:{i:04x}", "type": TYPES[i % len(TYPES)], "name": f"{i}"}
+                for i in range(MODULES)
+            ],
+            "rooms": [],
+        },
+    )
+    payloads = [payload(0), payload(1)]
+    await home.update({"home": {"modules": payloads[0]}})
+
+    modules = list(home.modules.values())
+    legacy = [
+        LegacyEntity({key: getattr(m, key) for key in m.attribute_names()})
+        for m in modules
+    ]
+
+    def apply_updaters(run: int) -> None:
+        for module, raw in zip(modules, payloads[run % 2]):
+            module.changes = {}
+            UPDATERS[type(module)].apply(module, raw)
+
+    def apply_legacy(run: int) -> None:
+        for entity, raw in zip(legacy, payloads[run % 2]):
+            entity.changes = {}
+            legacy_update_attributes(entity, raw)
+
+    print(f"{MODULES} modules, {RUNS} updates")
+    print(f"  dict rebuild:        {timed(apply_legacy):6.2f} ms/update")
+    print(f"  attribute updaters:  {timed(apply_updaters):6.2f} ms/update")
+
+    start = time.perf_counter()
+    for run in range(RUNS):
+        await home.update({"home": {"modules": payloads[run % 2]}})
+    print(
+        f"  Home.update:         {(time.perf_counter() - start) / RUNS * 1000:6.2f} ms/update"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,94 @@
+"""Benchmark the module to events index of a home.
+
+Uses a synthetic home with 50 cameras, 50 door tags and 500 events. It
+compares a scan of all events per module with the single pass index
+built by Home.merge_events.
+
+    python benchmarks/event_index.py
+"""
+from __future__ import annotations
+
+# Import asyncio before the integration directory shadows the stdlib select
+import asyncio  # noqa: F401
+from pathlib import Path
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "custom_components" / "netatmo"))
+
+from pyatmo.event import EventStore  # noqa: E402
+from pyatmo.home import Home, event_module_id  # noqa: E402
+
+CAMERAS = 50
+TAGS = 50
+EVENTS = 500
+RUNS = 200
+
+
+def main() -> None:
+    home = Home(
+        None,
+        {
+            "id": "home",
+            "name": "Home",
+            "modules": [
+                *(
+                    {"id": f"cam{i}", "type": "NACamera", "name": f"Camera {i}"}
+                    for i in range(CAMERAS)
+                ),
+                *(
+                    {"id": f"tag{i}", "type": "NACamDoorTag", "name": f"Tag {i}"}
+                    for i in range(TAGS)
+                ),
+            ],
+            "rooms": [],
+        },
+    )
+    now = int(time.time())
+    raw_events = [
+        {
+            "id": f"event{i}",
+            "type": "movement",
+            "time": now - EVENTS + i,
+            "module_id": f"cam{i % CAMERAS}",
+        }
+        for i in range(EVENTS)
+    ]
+
+    def merge() -> None:
+        home.events = EventStore(home.entity_id, max_events=EVENTS)
+        home.events_by_module = {}
+        home.merge_events(raw_events)
+
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        merge()
+    merged = (time.perf_counter() - start) / RUNS * 1000
+
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        {
+            module_id: [
+                event
+                for event in home.events.values()
+                if event_module_id(event) == module_id
+            ]
+            for module_id in home.modules
+        }
+    scanned = (time.perf_counter() - start) / RUNS * 1000
+
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        index: dict[str | None, list] = {}
+        for event in home.events.values():
+            index.setdefault(event_module_id(event), []).append(event)
+    indexed = (time.perf_counter() - start) / RUNS * 1000
+
+    print(f"{CAMERAS} cameras, {TAGS} door tags, {EVENTS} events, {RUNS} runs")
+    print(f"  per module scan:       {scanned:6.3f} ms")
+    print(f"  single pass index:     {indexed:6.3f} ms")
+    print(f"  Home.merge_events:     {merged:6.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Measure the memory retained per module, for each device type.
+
+Compares dict-backed module instances with the slotted classes generated
+by compact_class, for 1,000 modules per type after one status update.
+
+    python benchmarks/module_memory.py
+"""
+from __future__ import annotations
+
+# Import asyncio before the integration directory shadows the stdlib select
+import asyncio
+import json
+from pathlib import Path
+import sys
+import tracemalloc
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "custom_components" / "netatmo"))
+
+from pyatmo import modules  # noqa: E402
+from pyatmo.home import Home  # noqa: E402
+
+MODULES = 1000
+TYPES = ["NLP", "NLF", "NLV", "NLPM", "NLT", "NATherm1", "NRV", "NACamera", "NAMain"]
+
+
+def raw_modules(device_type: str) -> list[dict]:
+    # Round trip through JSON so ids are not shared with the benchmark
+    return json.loads(
+        json.dumps(
+            [
+                {
+                    "id": f"70:ee:50:{i >> 8:02x}:{i & 255:02x}:00",
+                    "type": device_type,
+                    "name": f"Module {i}",
+                    "bridge": "70:ee:50:00:00:aa",
+                    "room_id": "1234",
+                }
+                for i in range(MODULES)
+            ]
+        )
+    )
+
+
+def dict_backed(home: Home, raw: dict) -> modules.Module:
+    """Create a module without its generated slotted class."""
+    cls = getattr(modules, raw["type"])
+    module = object.__new__(cls)
+    cls.__init__(module, home, raw)
+    return module
+
+
+def status(raw: list[dict]) -> dict:
+    return json.loads(
+        json.dumps(
+            {
+                "home": {
+                    "modules": [
+                        {
+                            "id": module["id"],
+                            "type": module["type"],
+                            "reachable": True,
+                            "on": True,
+                            "power": 12,
+                            "firmware_revision": 42,
+                            "rf_strength": 70,
+                            "battery_state": "high",
+                        }
+                        for module in raw
+                    ]
+                }
+            }
+        )
+    )
+
+
+async def retained(device_type: str, slotted: bool) -> float:
+    raw = raw_modules(device_type)
+    payload = status(raw)
+    # Generate the slotted class before measuring
+    getattr(modules, device_type)(home=None, module=raw_modules(device_type)[0])
+
+    tracemalloc.start()
+    home = Home(None, {"id": "home", "name": "Home", "modules": [], "rooms": []})
+    for module in raw:
+        home.modules[module["id"]] = (
+            getattr(modules, device_type)(home=home, module=module)
+            if slotted
+            else dict_backed(home, module)
+        )
+    await home.update(payload)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / MODULES
+
+
+async def main() -> None:
+    print(f"Retained bytes per module, {MODULES} modules per type")
+    print(f"  {'type':9s} {'dict':>7s} {'slots':>7s}")
+    for device_type in TYPES:
+        print(
+            f"  {device_type:9s}"
+            f" {await retained(device_type, False):7.0f}"
+            f" {await retained(device_type, True):7.0f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,128 @@
+"""Benchmark webhook routing on a burst of 1,000 events across 20 homes.
+
+Compares a broadcast to every entity of an event type, each filtering
+the payload itself, with the WebhookRouter table. Requires Home Assistant
+to be installed.
+
+    python benchmarks/webhook_routing.py
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+import random
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+from custom_components.netatmo.webhook import WebhookRouter  # noqa: E402
+
+HOMES = 20
+ROOMS = 10
+CAMERAS = 3
+EVENTS = 1000
+RUNS = 20
+
+HOME_TYPES = ("therm_mode", "schedule")
+ROOM_TYPES = ("set_point", "cancel_set_point")
+CAMERA_TYPES = ("on", "off", "light_mode")
+
+deliveries = 0
+
+
+def deliver(event: dict) -> None:
+    global deliveries
+    deliveries += 1
+
+
+def climate(home_id: str, room_id: str) -> Callable[[dict], None]:
+    """Return a climate handler filtering the events the way entities did."""
+
+    def handle_event(event: dict) -> None:
+        data = event["data"]
+        if data["home_id"] != home_id:
+            return
+        if data["event_type"] in HOME_TYPES:
+            deliver(event)
+            return
+        for room in data.get("home", {}).get("rooms", []):
+            if room["id"] == room_id:
+                deliver(event)
+                return
+
+    return handle_event
+
+
+def camera(home_id: str, camera_id: str) -> Callable[[dict], None]:
+    """Return a camera handler filtering the events the way entities did."""
+
+    def handle_event(event: dict) -> None:
+        data = event["data"]
+        if data["home_id"] == home_id and data.get("camera_id") == camera_id:
+            deliver(event)
+
+    return handle_event
+
+
+def main() -> None:
+    random.seed(0)
+    broadcast: dict[str, list[Callable[[dict], None]]] = {}
+    router = WebhookRouter()
+
+    for home in range(HOMES):
+        home_id = f"home{home}"
+        for room in range(ROOMS):
+            room_id = f"{home_id}-room{room}"
+            handler = climate(home_id, room_id)
+            for event_type in (*HOME_TYPES, *ROOM_TYPES):
+                broadcast.setdefault(event_type, []).append(handler)
+            for event_type in HOME_TYPES:
+                router.async_register(event_type, home_id, None, deliver)
+            for event_type in ROOM_TYPES:
+                router.async_register(event_type, home_id, room_id, deliver)
+        for cam in range(CAMERAS):
+            camera_id = f"{home_id}-camera{cam}"
+            handler = camera(home_id, camera_id)
+            for event_type in CAMERA_TYPES:
+                broadcast.setdefault(event_type, []).append(handler)
+                router.async_register(event_type, home_id, camera_id, deliver)
+
+    events = []
+    for _ in range(EVENTS):
+        home_id = f"home{random.randrange(HOMES)}"
+        event_type = random.choice((*HOME_TYPES, *ROOM_TYPES, *CAMERA_TYPES))
+        data = {"home_id": home_id, "event_type": event_type}
+        if event_type in CAMERA_TYPES:
+            data["camera_id"] = f"{home_id}-camera{random.randrange(CAMERAS)}"
+        else:
+            rooms = [{"id": f"{home_id}-room{random.randrange(ROOMS)}"}]
+            data["home"] = {
+                "id": home_id,
+                "rooms": rooms if event_type in ROOM_TYPES else [],
+            }
+        events.append((event_type, {"type": event_type, "data": data}))
+
+    def run_broadcast() -> None:
+        for event_type, event in events:
+            for handler in broadcast.get(event_type, ()):
+                handler(event)
+
+    def run_router() -> None:
+        for event_type, event in events:
+            router.async_route(event_type, event)
+
+    global deliveries
+    print(f"{EVENTS} events across {HOMES} homes, best of {RUNS} runs")
+    for name, run in (("broadcast", run_broadcast), ("routing table", run_router)):
+        best = float("inf")
+        for _ in range(RUNS):
+            deliveries = 0
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        print(f"  {name:14s} {best * 1000:6.2f} ms, {deliveries} deliveries")
+
+
+if __name__ == "__main__":
+    main()
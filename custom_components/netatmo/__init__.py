@@ -40,13 +40,18 @@ from . import api, config_flow
 from .const import (
     AUTH,
     CONF_CLOUDHOOK_URL,
+    CONF_SNAPSHOT_TTL,
     DATA_CAMERAS,
     DATA_DEVICE_IDS,
-    DATA_EVENTS,
+    DATA_EVENT_HISTORY,
     DATA_HANDLER,
     DATA_HOMES,
     DATA_PERSONS,
     DATA_SCHEDULES,
+    DATA_SNAPSHOTS,
+    DATA_WEBHOOK_QUEUE,
+    DATA_WEBHOOK_ROUTER,
+    DEFAULT_SNAPSHOT_TTL,
     DOMAIN,
     OAUTH2_AUTHORIZE,
     OAUTH2_TOKEN,
@@ -55,7 +60,9 @@ from .const import (
     WEBHOOK_PUSH_TYPE,
 )
 from .data_handler import NetatmoDataHandler
-from .webhook import async_handle_webhook
+from .event_history import EVENT_HISTORY_FILE, EventHistory
+from .snapshot import SnapshotCache
+from .webhook import WebhookIngestQueue, WebhookRouter, async_handle_webhook
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -81,8 +88,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         DATA_DEVICE_IDS: {},
         DATA_SCHEDULES: {},
         DATA_HOMES: {},
-        DATA_EVENTS: {},
         DATA_CAMERAS: {},
+        DATA_WEBHOOK_QUEUE: WebhookIngestQueue(hass),
+        DATA_WEBHOOK_ROUTER: WebhookRouter(),
     }
 
     if DOMAIN not in config:
@@ -134,10 +142,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
         raise ConfigEntryAuthFailed("Token scope not valid, trigger renewal")
 
+    if DATA_EVENT_HISTORY not in hass.data[DOMAIN]:
+        history = EventHistory(hass, hass.config.path(EVENT_HISTORY_FILE))
+        await history.async_setup()
+        hass.data[DOMAIN][DATA_EVENT_HISTORY] = history
+
     hass.data[DOMAIN][entry.entry_id] = {
         AUTH: api.AsyncConfigEntryNetatmoAuth(
             aiohttp_client.async_get_clientsession(hass), session
-        )
+        ),
+        DATA_SNAPSHOTS: SnapshotCache(
+            hass, entry.options.get(CONF_SNAPSHOT_TTL, DEFAULT_SNAPSHOT_TTL)
+        ),
     }
 
     data_handler = NetatmoDataHandler(hass, entry)
@@ -150,9 +166,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if CONF_WEBHOOK_ID not in entry.data:
             return
         _LOGGER.debug("Unregister Netatmo webhook (%s)", entry.data[CONF_WEBHOOK_ID])
-        async_dispatcher_send(
-            hass,
-            f"signal-{DOMAIN}-webhook-None",
+        hass.data[DOMAIN][DATA_WEBHOOK_ROUTER].async_route(
+            "None",
             {"type": "None", "data": {WEBHOOK_PUSH_TYPE: WEBHOOK_DEACTIVATION}},
         )
         webhook_unregister(hass, entry.data[CONF_WEBHOOK_ID])
@@ -243,6 +258,9 @@ async def async_cloudhook_generate_url(hass: HomeAssistant, entry: ConfigEntry)
 
 async def async_config_entry_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle signals of config entry being updated."""
+    hass.data[DOMAIN][entry.entry_id][DATA_SNAPSHOTS].ttl = entry.options.get(
+        CONF_SNAPSHOT_TTL, DEFAULT_SNAPSHOT_TTL
+    )
     async_dispatcher_send(hass, f"signal-{DOMAIN}-public-update-{entry.entry_id}")
 
 
@@ -260,6 +278,17 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok and entry.entry_id in data:
         data.pop(entry.entry_id)
 
+    # The event history is shared by the config entries
+    if (
+        unload_ok
+        and DATA_EVENT_HISTORY in data
+        and not any(
+            other.entry_id in data
+            for other in hass.config_entries.async_entries(DOMAIN)
+        )
+    ):
+        await data.pop(DATA_EVENT_HISTORY).async_close()
+
     return unload_ok
 
 
@@ -6,6 +6,8 @@ from typing import Any, cast
 
 import aiohttp
 from .pyatmo import ApiError as NetatmoApiError, modules as NaModules
+from .pyatmo.helpers import image_type
+from .pyatmo.home import event_module_id
 import voluptuous as vol
 
 from homeassistant.components.camera import SUPPORT_ON_OFF, SUPPORT_STREAM, Camera
@@ -23,7 +25,9 @@ from .const import (
     CAMERA_LIGHT_MODES,
     CONF_URL_SECURITY,
     DATA_CAMERAS,
-    DATA_EVENTS,
+    DATA_EVENT_HISTORY,
+    DATA_SNAPSHOTS,
+    DEFAULT_QUALITY,
     DOMAIN,
     EVENT_TYPE_LIGHT_MODE,
     EVENT_TYPE_OFF,
@@ -33,17 +37,13 @@ from .const import (
     SERVICE_SET_CAMERA_LIGHT,
     SERVICE_SET_PERSON_AWAY,
     SERVICE_SET_PERSONS_HOME,
-    WEBHOOK_LIGHT_MODE,
-    WEBHOOK_NACAMERA_CONNECTION,
-    WEBHOOK_PUSH_TYPE,
 )
 from .data_handler import EVENT, HOME, SIGNAL_NAME, NetatmoDevice
+from .helper import event_data
 from .netatmo_entity_base import NetatmoBase
 
 _LOGGER = logging.getLogger(__name__)
 
-DEFAULT_QUALITY = "high"
-
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -101,6 +101,7 @@ class NetatmoCamera(NetatmoBase, Camera):
         self._quality = DEFAULT_QUALITY
         self._monitoring: bool | None = None
         self._light_state = None
+        self._event_revision: int | None = None
         self._attr_brand = MANUFACTURER
 
         self._publishers.extend(
@@ -108,11 +109,13 @@ class NetatmoCamera(NetatmoBase, Camera):
                 {
                     "name": HOME,
                     "home_id": self._home_id,
+                    "target_id": self._id,
                     SIGNAL_NAME: f"{HOME}-{self._home_id}",
                 },
                 {
                     "name": EVENT,
                     "home_id": self._home_id,
+                    "target_id": self._id,
                     SIGNAL_NAME: f"{EVENT}-{self._home_id}",
                 },
             ]
@@ -122,48 +125,34 @@ class NetatmoCamera(NetatmoBase, Camera):
         """Entity created."""
         await super().async_added_to_hass()
 
-        for event_type in (EVENT_TYPE_LIGHT_MODE, EVENT_TYPE_OFF, EVENT_TYPE_ON):
-            self.data_handler.config_entry.async_on_unload(
-                async_dispatcher_connect(
-                    self.hass,
-                    f"signal-{DOMAIN}-webhook-{event_type}",
-                    self.handle_event,
-                )
-            )
+        self.async_route_webhook_events(
+            self.handle_event,
+            [EVENT_TYPE_LIGHT_MODE, EVENT_TYPE_OFF, EVENT_TYPE_ON],
+            self._home_id,
+            self._id,
+        )
 
         self.hass.data[DOMAIN][DATA_CAMERAS][self._id] = self._device_name
 
     @callback
     def handle_event(self, event: dict) -> None:
-        """Handle webhook events."""
-        data = event["data"]
-
-        if not data.get("camera_id"):
-            return
-
-        if data["home_id"] == self._home_id and data["camera_id"] == self._id:
-            if data[WEBHOOK_PUSH_TYPE] in ("NACamera-off", "NACamera-disconnection"):
-                self._attr_is_streaming = False
-                self._monitoring = False
-            elif data[WEBHOOK_PUSH_TYPE] in (
-                "NACamera-on",
-                WEBHOOK_NACAMERA_CONNECTION,
-            ):
-                self._attr_is_streaming = True
-                self._monitoring = True
-            elif data[WEBHOOK_PUSH_TYPE] == WEBHOOK_LIGHT_MODE:
-                self._light_state = data["sub_type"]
-                self._attr_extra_state_attributes.update(
-                    {"light_state": self._light_state}
-                )
-
-            self.async_write_ha_state()
-            return
+        """Handle webhook events once the data handler patched the camera."""
+        self.async_update_callback()
+        self.async_write_ha_state()
 
     async def async_camera_image(
         self, width: int | None = None, height: int | None = None
     ) -> bytes | None:
         """Return a still image response from the camera."""
+        image = await self.hass.data[DOMAIN][self.data_handler.config_entry.entry_id][
+            DATA_SNAPSHOTS
+        ].async_get(self._id, self._async_fetch_snapshot, width, height)
+        if image and (kind := image_type(image)) is not None:
+            self.content_type = f"image/{kind}"
+        return image
+
+    async def _async_fetch_snapshot(self) -> bytes | None:
+        """Fetch a live snapshot from the camera."""
         try:
             return cast(bytes, await self._camera.async_get_live_snapshot())
         except (
@@ -193,9 +182,9 @@ class NetatmoCamera(NetatmoBase, Camera):
         await self._camera.async_monitoring_on()
 
     async def stream_source(self) -> str:
-        """Return the stream source."""
+        """Return the stream source, validating the camera urls in the background."""
         if self._camera.is_local:
-            await self._camera.async_update_camera_urls()
+            self.data_handler.async_probe_camera_urls(self._home_id)
 
         url = "{0}/live/files/{1}/index.m3u8"
         if self._camera.local_url:
@@ -209,12 +198,13 @@ class NetatmoCamera(NetatmoBase, Camera):
         self._attr_available = self._camera.alim_status is not None
 
         if self._camera.monitoring is not None:
+            self._monitoring = self._camera.monitoring
             self._attr_is_streaming = self._camera.monitoring
             self._attr_motion_detection_enabled = self._camera.monitoring
 
-        self.hass.data[DOMAIN][DATA_EVENTS][self._id] = self.process_events(
-            self._camera.events
-        )
+        self._light_state = getattr(self._camera, "floodlight", self._light_state)
+
+        self.async_update_events()
 
         self._attr_extra_state_attributes.update(
             {
@@ -229,27 +219,37 @@ class NetatmoCamera(NetatmoBase, Camera):
             }
         )
 
-    def process_events(self, event_list: list) -> dict:
-        """Add meta data to events."""
-        events = {}
-        for event in event_list:
-            if not (video_id := getattr(event, "video_id")):
-                continue
-            event_data = event.__dict__
-            event_data["subevents"] = [
-                event.__dict__
-                for event in event_data.get("subevents", [])
-                if not isinstance(event, dict)
+    @callback
+    def async_update_events(self) -> None:
+        """Record the new and updated events of the camera in the event history."""
+        store = self._camera.home.events
+
+        if (
+            self._event_revision is None
+            or (delta := store.changes_since(self._event_revision)) is None
+        ):
+            events = self._camera.home.events_by_module.get(self._id, [])
+        else:
+            events = [
+                event for event in delta.changed if event_module_id(event) == self._id
             ]
-            event_data["media_url"] = self.get_video_url(video_id)
-            events[event.event_time] = event_data
-        return events
 
-    def get_video_url(self, video_id: str) -> str:
-        """Get video url."""
-        if self._camera.is_local:
-            return f"{self._camera.local_url}/vod/{video_id}/files/{self._quality}/index.m3u8"
-        return f"{self._camera.vpn_url}/vod/{video_id}/files/{self._quality}/index.m3u8"
+        if processed := self.process_events(events):
+            self.hass.data[DOMAIN][DATA_EVENT_HISTORY].async_add(
+                self._home_id, self._id, processed
+            )
+        self._event_revision = store.revision
+
+    def process_events(self, event_list: list) -> list[dict]:
+        """Return the data of the events with a recording.
+
+        Media urls are built when resolved, since the camera urls change.
+        """
+        return [
+            event_data(event)
+            for event in event_list
+            if getattr(event, "video_id", None)
+        ]
 
     def fetch_person_ids(self, persons: list[str | None]) -> list[str]:
         """Fetch matching person ids for give list of persons."""
@@ -17,7 +17,6 @@ from homeassistant.components.climate.const import (
     HVAC_MODE_OFF,
     PRESET_AWAY,
     PRESET_BOOST,
-    PRESET_HOME,
     SUPPORT_PRESET_MODE,
     SUPPORT_TARGET_TEMPERATURE,
 )
@@ -183,95 +182,23 @@ class NetatmoThermostat(NetatmoBase, ClimateEntity):
         """Entity created."""
         await super().async_added_to_hass()
 
-        for event_type in (
-            EVENT_TYPE_SET_POINT,
-            EVENT_TYPE_THERM_MODE,
-            EVENT_TYPE_CANCEL_SET_POINT,
-            EVENT_TYPE_SCHEDULE,
-        ):
-            self.data_handler.config_entry.async_on_unload(
-                async_dispatcher_connect(
-                    self.hass,
-                    f"signal-{DOMAIN}-webhook-{event_type}",
-                    self.handle_event,
-                )
-            )
+        self.async_route_webhook_events(
+            self.handle_event,
+            [EVENT_TYPE_THERM_MODE, EVENT_TYPE_SCHEDULE],
+            self._room.home.entity_id,
+        )
+        self.async_route_webhook_events(
+            self.handle_event,
+            [EVENT_TYPE_SET_POINT, EVENT_TYPE_CANCEL_SET_POINT],
+            self._room.home.entity_id,
+            self._room.entity_id,
+        )
 
     @callback
     def handle_event(self, event: dict) -> None:
-        """Handle webhook events."""
-        data = event["data"]
-
-        if self._room.home.entity_id != data["home_id"]:
-            return
-
-        if data["event_type"] == EVENT_TYPE_SCHEDULE and "schedule_id" in data:
-            self._selected_schedule = getattr(
-                self.hass.data[DOMAIN][DATA_SCHEDULES][self._room.home.entity_id].get(
-                    data["schedule_id"]
-                ),
-                "name",
-                None,
-            )
-            self._attr_extra_state_attributes[
-                ATTR_SELECTED_SCHEDULE
-            ] = self._selected_schedule
-            self.async_write_ha_state()
-            self.data_handler.async_force_update(self._signal_name)
-            return
-
-        home = data["home"]
-
-        if self._room.home.entity_id != home["id"]:
-            return
-
-        if data["event_type"] == EVENT_TYPE_THERM_MODE:
-            self._attr_preset_mode = NETATMO_MAP_PRESET[home[EVENT_TYPE_THERM_MODE]]
-            self._attr_hvac_mode = HVAC_MAP_NETATMO[self._attr_preset_mode]
-            if self._attr_preset_mode == PRESET_FROST_GUARD:
-                self._attr_target_temperature = self._hg_temperature
-            elif self._attr_preset_mode == PRESET_AWAY:
-                self._attr_target_temperature = self._away_temperature
-            elif self._attr_preset_mode in [PRESET_SCHEDULE, PRESET_HOME]:
-                self.async_update_callback()
-                self.data_handler.async_force_update(self._signal_name)
-            self.async_write_ha_state()
-            return
-
-        for room in home.get("rooms", []):
-            if (
-                data["event_type"] == EVENT_TYPE_SET_POINT
-                and self._room.entity_id == room["id"]
-            ):
-                if room["therm_setpoint_mode"] == STATE_NETATMO_OFF:
-                    self._attr_hvac_mode = HVAC_MODE_OFF
-                    self._attr_preset_mode = STATE_NETATMO_OFF
-                    self._attr_target_temperature = 0
-                elif room["therm_setpoint_mode"] == STATE_NETATMO_MAX:
-                    self._attr_hvac_mode = HVAC_MODE_HEAT
-                    self._attr_preset_mode = PRESET_MAP_NETATMO[PRESET_BOOST]
-                    self._attr_target_temperature = DEFAULT_MAX_TEMP
-                elif room["therm_setpoint_mode"] == STATE_NETATMO_MANUAL:
-                    self._attr_hvac_mode = HVAC_MODE_HEAT
-                    self._attr_target_temperature = room["therm_setpoint_temperature"]
-                else:
-                    self._attr_target_temperature = room["therm_setpoint_temperature"]
-                    if self._attr_target_temperature == DEFAULT_MAX_TEMP:
-                        self._attr_hvac_mode = HVAC_MODE_HEAT
-                self.async_write_ha_state()
-                return
-
-            if (
-                data["event_type"] == EVENT_TYPE_CANCEL_SET_POINT
-                and self._room.entity_id == room["id"]
-            ):
-                if self.hvac_mode == HVAC_MODE_OFF:
-                    self._attr_hvac_mode = HVAC_MODE_AUTO
-                    self._attr_preset_mode = PRESET_MAP_NETATMO[PRESET_SCHEDULE]
-
-                self.async_update_callback()
-                self.async_write_ha_state()
-                return
+        """Handle webhook events once the data handler patched the room."""
+        self.async_update_callback()
+        self.async_write_ha_state()
 
     @property
     def hvac_action(self) -> str | None:
@@ -21,8 +21,10 @@ from .const import (
     CONF_LON_SW,
     CONF_NEW_AREA,
     CONF_PUBLIC_MODE,
+    CONF_SNAPSHOT_TTL,
     CONF_UUID,
     CONF_WEATHER_AREAS,
+    DEFAULT_SNAPSHOT_TTL,
     DOMAIN,
 )
 
@@ -132,6 +134,10 @@ class NetatmoOptionsFlowHandler(config_entries.OptionsFlow):
                     default=weather_areas,
                 ): cv.multi_select({wa: None for wa in weather_areas}),
                 vol.Optional(CONF_NEW_AREA): str,
+                vol.Optional(
+                    CONF_SNAPSHOT_TTL,
+                    default=self.options.get(CONF_SNAPSHOT_TTL, DEFAULT_SNAPSHOT_TTL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=300)),
             }
         )
         return self.async_show_form(
@@ -51,16 +51,20 @@ CONF_LAT_SW = "lat_sw"
 CONF_LON_SW = "lon_sw"
 CONF_PUBLIC_MODE = "mode"
 CONF_UUID = "uuid"
+CONF_SNAPSHOT_TTL = "snapshot_ttl"
 
 OAUTH2_AUTHORIZE = "https://api.netatmo.com/oauth2/authorize"
 OAUTH2_TOKEN = "https://api.netatmo.com/oauth2/token"
 
 DATA_CAMERAS = "cameras"
 DATA_DEVICE_IDS = "netatmo_device_ids"
-DATA_EVENTS = "netatmo_events"
+DATA_EVENT_HISTORY = "netatmo_event_history"
 DATA_HOMES = "netatmo_homes"
 DATA_PERSONS = "netatmo_persons"
 DATA_SCHEDULES = "netatmo_schedules"
+DATA_SNAPSHOTS = "netatmo_snapshots"
+DATA_WEBHOOK_QUEUE = "netatmo_webhook_queue"
+DATA_WEBHOOK_ROUTER = "netatmo_webhook_router"
 
 NETATMO_WEBHOOK_URL = None
 NETATMO_EVENT = "netatmo_event"
@@ -68,6 +72,8 @@ NETATMO_EVENT = "netatmo_event"
 DEFAULT_PERSON = "unknown"
 DEFAULT_DISCOVERY = True
 DEFAULT_WEBHOOKS = False
+DEFAULT_SNAPSHOT_TTL = 10
+DEFAULT_QUALITY = "high"
 
 ATTR_PSEUDO = "pseudo"
 ATTR_EVENT_TYPE = "event_type"
@@ -158,5 +164,22 @@ CAMERA_LIGHT_MODES = [MODE_LIGHT_ON, MODE_LIGHT_OFF, MODE_LIGHT_AUTO]
 WEBHOOK_ACTIVATION = "webhook_activation"
 WEBHOOK_DEACTIVATION = "webhook_deactivation"
 WEBHOOK_NACAMERA_CONNECTION = "NACamera-connection"
+WEBHOOK_NEW_MODULE = "new_module"
+WEBHOOK_MODULE_CONNECT = "module_connect"
+WEBHOOK_MODULE_DISCONNECT = "module_disconnect"
+WEBHOOK_TOPOLOGY_EVENTS = [
+    WEBHOOK_NEW_MODULE,
+    WEBHOOK_MODULE_CONNECT,
+    WEBHOOK_MODULE_DISCONNECT,
+]
+WEBHOOK_STATE_EVENTS = [
+    EVENT_TYPE_SET_POINT,
+    EVENT_TYPE_CANCEL_SET_POINT,
+    EVENT_TYPE_THERM_MODE,
+    EVENT_TYPE_SCHEDULE,
+    EVENT_TYPE_ON,
+    EVENT_TYPE_OFF,
+    EVENT_TYPE_LIGHT_MODE,
+]
 WEBHOOK_PUSH_TYPE = "push_type"
 WEBHOOK_LIGHT_MODE = "NOC-light_mode"
@@ -71,6 +71,7 @@ class NetatmoCover(NetatmoBase, CoverEntity):
                 {
                     "name": HOME,
                     "home_id": self._home_id,
+                    "target_id": self._id,
                     SIGNAL_NAME: self._signal_name,
                 },
             ]
@@ -2,10 +2,9 @@
 from __future__ import annotations
 
 import asyncio
-from collections import deque
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from itertools import islice
+import heapq
 import logging
 from time import time
 from typing import Any
@@ -15,16 +14,18 @@ from .pyatmo.modules.device_types import DeviceCategory as NetatmoDeviceCategory
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
-from homeassistant.helpers.dispatcher import (
-    async_dispatcher_connect,
-    async_dispatcher_send,
-)
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_time_interval
 
 from .const import (
+    ATTR_EVENT_TYPE,
+    ATTR_HOME_ID,
     AUTH,
+    DATA_DEVICE_IDS,
     DATA_PERSONS,
     DATA_SCHEDULES,
+    DATA_WEBHOOK_ROUTER,
     DOMAIN,
     MANUFACTURER,
     NETATMO_CREATE_BATTERY,
@@ -43,6 +44,8 @@ from .const import (
     WEBHOOK_DEACTIVATION,
     WEBHOOK_NACAMERA_CONNECTION,
     WEBHOOK_PUSH_TYPE,
+    WEBHOOK_STATE_EVENTS,
+    WEBHOOK_TOPOLOGY_EVENTS,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -65,6 +68,7 @@ PUBLISHERS = {
 }
 
 BATCH_SIZE = 3
+MAX_CONCURRENT_FETCHES = 3
 DEFAULT_INTERVALS = {
     ACCOUNT: 10800,
     HOME: 300,
@@ -75,6 +79,44 @@ DEFAULT_INTERVALS = {
 }
 SCAN_INTERVAL = 60
 
+# Topology changes are pushed through the webhook, poll them daily only
+WEBHOOK_TOPOLOGY_INTERVAL = 86400
+# Wait for bursts of topology events to settle before refreshing
+TOPOLOGY_REFRESH_COOLDOWN = 30
+
+NETATMO_TYPE_SIGNAL_MAP = {
+    NetatmoDeviceCategory.camera: [
+        NETATMO_CREATE_CAMERA,
+        NETATMO_CREATE_CAMERA_LIGHT,
+    ],
+    NetatmoDeviceCategory.dimmer: [NETATMO_CREATE_LIGHT],
+    NetatmoDeviceCategory.shutter: [NETATMO_CREATE_COVER],
+    NetatmoDeviceCategory.switch: [
+        NETATMO_CREATE_SWITCH,
+        NETATMO_CREATE_SENSOR,
+    ],
+    NetatmoDeviceCategory.meter: [NETATMO_CREATE_SENSOR],
+}
+
+# Publishers whose interval adapts to the measurement cadence of their devices
+ADAPTIVE_PUBLISHERS = {
+    WEATHER: NetatmoDeviceCategory.weather,
+    AIR_CARE: NetatmoDeviceCategory.air_care,
+}
+# Poll this long after a measurement is expected to be available
+CADENCE_GRACE = 30
+# Weight of a new observation in the learned cadence
+CADENCE_SMOOTHING = 0.25
+# Gaps longer than this many cadences are missed measurements, not cadence
+CADENCE_MAX_GAP = 1.5
+# Longest wait between checks for a late measurement
+CADENCE_MAX_BACKOFF = 300
+
+# Stretch publisher intervals up to MAX_INTERVAL_STRETCH times once less
+# than RATE_BUDGET_LOW of the API request budget is left
+RATE_BUDGET_LOW = 0.5
+MAX_INTERVAL_STRETCH = 4
+
 
 @dataclass
 class NetatmoDevice:
@@ -116,6 +158,39 @@ class NetatmoPublisher:
     subscriptions: list[CALLBACK_TYPE | None]
     method: str
     kwargs: dict
+    category: NetatmoDeviceCategory | None = None
+    data_time: int | None = None
+    cadence: float | None = None
+    targets: dict[str, list[CALLBACK_TYPE]] = field(default_factory=dict)
+    targeted: set[CALLBACK_TYPE] = field(default_factory=set)
+
+    def learn_cadence(self, data_time: int) -> None:
+        """Learn the measurement cadence from the latest data timestamp."""
+        if self.data_time is not None and data_time > self.data_time:
+            delta = data_time - self.data_time
+            if self.cadence is None:
+                self.cadence = delta
+            elif delta <= CADENCE_MAX_GAP * self.cadence:
+                self.cadence += CADENCE_SMOOTHING * (delta - self.cadence)
+
+        if self.data_time is None or data_time > self.data_time:
+            self.data_time = data_time
+
+    def adaptive_interval(self, now: float) -> float:
+        """Return the delay until the next measurement is expected to be available."""
+        if self.cadence is None or self.data_time is None:
+            return self.interval
+
+        next_data = self.data_time + self.cadence + CADENCE_GRACE
+        if next_data > now:
+            return next_data - now
+
+        if (late := now - next_data) < self.cadence:
+            # The measurement is late, back off by doubling the time waited
+            return min(max(late, CADENCE_GRACE), CADENCE_MAX_BACKOFF)
+
+        # The device seems to be offline, fall back to the regular interval
+        return self.interval
 
 
 class NetatmoDataHandler:
@@ -123,32 +198,66 @@ class NetatmoDataHandler:
 
     account: pyatmo.AsyncAccount
 
-    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        batch_size: int = BATCH_SIZE,
+        max_concurrent_fetches: int = MAX_CONCURRENT_FETCHES,
+    ) -> None:
         """Initialize self."""
         self.hass = hass
         self.config_entry = config_entry
         self._auth = hass.data[DOMAIN][config_entry.entry_id][AUTH]
         self.publisher: dict = {}
-        self._queue: deque = deque()
+        self.batch_size = batch_size
+        self._queue: list[tuple[float, str]] = []
+        self._fetch_semaphore = asyncio.Semaphore(max_concurrent_fetches)
+        self._fetch_tasks: set[asyncio.Task] = set()
+        self._in_flight: dict[
+            tuple, tuple[asyncio.Task[set[str] | bool | None], set[str]]
+        ] = {}
+        self.coalesced_fetches = 0
+        self._url_probes: dict[str, asyncio.Task[None]] = {}
         self._webhook: bool = False
+        self._dispatched: bool = False
+        self._topology_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=TOPOLOGY_REFRESH_COOLDOWN,
+            immediate=False,
+            function=self.async_refresh_topology,
+        )
 
     async def async_setup(self) -> None:
         """Set up the Netatmo data handler."""
-        async_track_time_interval(
-            self.hass, self.async_update, timedelta(seconds=SCAN_INTERVAL)
-        )
-
         self.config_entry.async_on_unload(
-            async_dispatcher_connect(
-                self.hass,
-                f"signal-{DOMAIN}-webhook-None",
-                self.handle_event,
+            async_track_time_interval(
+                self.hass, self.async_update, timedelta(seconds=SCAN_INTERVAL)
             )
         )
+        self.config_entry.async_on_unload(self.async_cancel_fetches)
+
+        self.config_entry.async_on_unload(self._topology_debouncer.async_cancel)
 
         self.account = pyatmo.AsyncAccount(self._auth)
 
-        await self.subscribe(ACCOUNT, ACCOUNT, None)
+        router = self.hass.data[DOMAIN][DATA_WEBHOOK_ROUTER]
+        self.config_entry.async_on_unload(
+            router.async_register_batch(None, self.async_handle_webhook_events)
+        )
+        for event_type in WEBHOOK_STATE_EVENTS:
+            self.config_entry.async_on_unload(
+                router.async_register_batch(event_type, self.async_handle_state_events)
+            )
+
+        # Events without a type are routed as "None"
+        for event_type in ("None", *WEBHOOK_TOPOLOGY_EVENTS):
+            self.config_entry.async_on_unload(
+                router.async_register(event_type, None, None, self.handle_event)
+            )
+
+        await self.subscribe(ACCOUNT, ACCOUNT, self.async_handle_topology_changes)
 
         await asyncio.gather(
             *(
@@ -165,46 +274,299 @@ class NetatmoDataHandler:
         """
         Update device.
 
-        We do up to BATCH_SIZE calls in one update in order
-        to minimize the calls on the api service.
+        Due publishers are picked in deadline order. We do up to
+        batch_size calls in one update in order to minimize the calls
+        on the api service. The calls run concurrently, limited by
+        the fetch semaphore.
         """
-        for data_class in islice(self._queue, 0, BATCH_SIZE):
-            if data_class.next_scan > time():
+        due = self._pop_due_publishers(time())
+        stretch = self.interval_stretch()
+
+        for data_class_name in due:
+            data_class = self.publisher[data_class_name]
+            data_class.next_scan = time() + data_class.interval * stretch
+            self._schedule(data_class)
+
+        results = await asyncio.gather(
+            *(self._async_create_fetch_task(name) for name in due),
+            return_exceptions=True,
+        )
+
+        for data_class_name, result in zip(due, results):
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    "Unexpected error fetching %s data",
+                    data_class_name,
+                    exc_info=result,
+                )
+
+    def _async_create_fetch_task(self, signal_name: str) -> asyncio.Task:
+        """Start a tracked fetch task for a publisher."""
+        task = self.hass.async_create_task(self._async_fetch_limited(signal_name))
+        self._fetch_tasks.add(task)
+        task.add_done_callback(self._fetch_tasks.discard)
+        return task
+
+    async def _async_fetch_limited(self, signal_name: str) -> None:
+        """Fetch publisher data once a fetch slot is available."""
+        async with self._fetch_semaphore:
+            await self.async_fetch_data(signal_name)
+
+    @callback
+    def async_cancel_fetches(self) -> None:
+        """Cancel all in-flight fetches."""
+        for task in self._fetch_tasks:
+            task.cancel()
+
+    def _pop_due_publishers(self, now: float) -> list[str]:
+        """Pop up to batch_size due publishers from the deadline queue."""
+        due: list[str] = []
+        while self._queue and len(due) < self.batch_size:
+            next_scan, name = self._queue[0]
+
+            if (
+                name in due
+                or (data_class := self.publisher.get(name)) is None
+                or data_class.next_scan != next_scan
+            ):
+                # Entry got re-keyed, duplicated or its publisher was removed
+                heapq.heappop(self._queue)
                 continue
 
-            if data_class_name := data_class.name:
-                self.publisher[data_class_name].next_scan = time() + data_class.interval
+            if next_scan > now:
+                break
+
+            heapq.heappop(self._queue)
+            due.append(name)
 
-                await self.async_fetch_data(data_class_name)
+        return due
 
-        self._queue.rotate(BATCH_SIZE)
+    def _schedule(self, data_class: NetatmoPublisher) -> None:
+        """Add a publisher to the deadline queue at its next scan time."""
+        heapq.heappush(self._queue, (data_class.next_scan, data_class.name))
+
+        # Drop superseded entries once they outnumber the live ones
+        if len(self._queue) > 2 * len(self.publisher) + self.batch_size:
+            self._queue = [
+                (publisher.next_scan, publisher.name)
+                for publisher in self.publisher.values()
+            ]
+            heapq.heapify(self._queue)
 
     @callback
     def async_force_update(self, data_class_entry: str) -> None:
         """Prioritize data retrieval for given data class entry."""
         self.publisher[data_class_entry].next_scan = time()
-        self._queue.rotate(-(self._queue.index(self.publisher[data_class_entry])))
+        self._schedule(self.publisher[data_class_entry])
+
+    @callback
+    def async_postpone_update(self, data_class_entry: str) -> None:
+        """Push the next data retrieval back by a full interval."""
+        if (data_class := self.publisher.get(data_class_entry)) is None:
+            return
+
+        if (next_scan := time() + data_class.interval) > data_class.next_scan:
+            data_class.next_scan = next_scan
+            self._schedule(data_class)
+
+    def interval_stretch(self) -> float:
+        """Return the factor to stretch publisher intervals by."""
+        remaining = self._auth.rate_budget.remaining
+        if remaining >= RATE_BUDGET_LOW:
+            return 1.0
 
-    async def handle_event(self, event: dict) -> None:
+        return 1 + (MAX_INTERVAL_STRETCH - 1) * (
+            (RATE_BUDGET_LOW - remaining) / RATE_BUDGET_LOW
+        )
+
+    def queue_lag(self) -> dict[str, float]:
+        """Return the queue lag (now - next_scan) per publisher."""
+        now = time()
+        return {
+            name: now - data_class.next_scan
+            for name, data_class in self.publisher.items()
+        }
+
+    @callback
+    def handle_event(self, event: dict) -> None:
         """Handle webhook events."""
-        if event["data"][WEBHOOK_PUSH_TYPE] == WEBHOOK_ACTIVATION:
+        data = event["data"]
+        push_type = data.get(WEBHOOK_PUSH_TYPE, "")
+
+        if push_type == WEBHOOK_ACTIVATION:
             _LOGGER.info("%s webhook successfully registered", MANUFACTURER)
             self._webhook = True
+            self.set_interval(ACCOUNT, WEBHOOK_TOPOLOGY_INTERVAL)
+
+            # Fetch the events missed while the webhook was down
+            for home_id in self.account.homes:
+                if (signal_event := f"{EVENT}-{home_id}") in self.publisher:
+                    self.async_force_update(signal_event)
 
-        elif event["data"][WEBHOOK_PUSH_TYPE] == WEBHOOK_DEACTIVATION:
+        elif push_type == WEBHOOK_DEACTIVATION:
             _LOGGER.info("%s webhook unregistered", MANUFACTURER)
             self._webhook = False
+            self.set_interval(ACCOUNT, DEFAULT_INTERVALS[ACCOUNT])
 
-        elif event["data"][WEBHOOK_PUSH_TYPE] == WEBHOOK_NACAMERA_CONNECTION:
+        elif push_type == WEBHOOK_NACAMERA_CONNECTION:
             _LOGGER.debug("%s camera reconnected", MANUFACTURER)
-            self.async_force_update(ACCOUNT)
+            self.async_force_home_update(data.get(ATTR_HOME_ID))
+
+        elif (
+            data.get(ATTR_EVENT_TYPE) or push_type.rpartition("-")[2]
+        ) in WEBHOOK_TOPOLOGY_EVENTS:
+            _LOGGER.debug("%s topology event: %s", MANUFACTURER, push_type)
+            self.hass.async_create_task(self._topology_debouncer.async_call())
+
+    @callback
+    def async_handle_webhook_events(
+        self, home_id: str | None, events: list[dict]
+    ) -> None:
+        """Add webhook events to the event store until the next event update."""
+        if changed := self.account.add_webhook_events(
+            home_id, [event["data"] for event in events]
+        ):
+            if (data_class := self.publisher.get(f"{EVENT}-{home_id}")) is not None:
+                self._async_notify(data_class, changed)
+
+    @callback
+    def async_handle_state_events(
+        self, home_id: str | None, events: list[dict]
+    ) -> None:
+        """Patch the model with webhook payloads instead of polling the home."""
+        if (
+            changed := self.account.apply_webhook_events(
+                home_id, [event["data"] for event in events]
+            )
+        ) is None:
+            self.async_force_home_update(home_id)
+            return
+
+        if changed:
+            self.async_postpone_update(f"{HOME}-{home_id}")
+
+    async def async_refresh_topology(self) -> None:
+        """Refresh the topology on the next update."""
+        self.async_force_update(ACCOUNT)
+
+    @callback
+    def async_force_home_update(self, home_id: str | None) -> None:
+        """Prioritize the status update of a home, or all homes if unknown."""
+        if (signal_home := f"{HOME}-{home_id}") in self.publisher:
+            self.async_force_update(signal_home)
+            return
+
+        for home in self.account.homes.values():
+            if (signal_home := f"{HOME}-{home.entity_id}") in self.publisher:
+                self.async_force_update(signal_home)
+
+    def set_interval(self, data_class_entry: str, interval: int) -> None:
+        """Change the polling interval of a publisher."""
+        if (
+            data_class := self.publisher.get(data_class_entry)
+        ) is None or interval == data_class.interval:
+            return
+
+        data_class.next_scan += interval - data_class.interval
+        data_class.interval = interval
+        self._schedule(data_class)
 
     async def async_fetch_data(self, signal_name: str) -> None:
-        """Fetch data and notify."""
+        """
+        Fetch data and notify.
+
+        Concurrent fetches of the same method and arguments share one
+        in-flight request. Every publisher involved gets notified once.
+        Subscribers targeting a module or room are only called back if
+        that object changed.
+        """
+        data_class = self.publisher[signal_name]
+        key = (data_class.method, tuple(sorted(data_class.kwargs.items())))
+
+        if (in_flight := self._in_flight.get(key)) is None or in_flight[0].done():
+            task = self.hass.async_create_task(self._async_request(data_class))
+            in_flight = self._in_flight[key] = (task, set())
+            self._fetch_tasks.add(task)
+            task.add_done_callback(self._fetch_tasks.discard)
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self.coalesced_fetches += 1
+
+        task, signals = in_flight
+        first = signal_name not in signals
+        signals.add(signal_name)
+
+        if (changed := await asyncio.shield(task)) is None or not first:
+            return
+
+        if (data_class := self.publisher.get(signal_name)) is None:
+            return
+
+        if data_class.category is not None:
+            self._async_adapt_interval(data_class, data_class.category)
+
+        if data_class.method == PUBLISHERS[HOME]:
+            self.async_probe_camera_urls(data_class.kwargs["home_id"])
+
+        if changed is not False:
+            self._async_notify(data_class, changed)
+
+    @callback
+    def async_probe_camera_urls(self, home_id: str) -> None:
+        """Validate the expired camera urls of a home in the background."""
+        if home_id in self._url_probes or home_id not in self.account.homes:
+            return
+
+        task = self._url_probes[home_id] = self.hass.async_create_task(
+            self._async_probe_camera_urls(home_id)
+        )
+        self._fetch_tasks.add(task)
+        task.add_done_callback(self._fetch_tasks.discard)
+        task.add_done_callback(lambda _: self._url_probes.pop(home_id, None))
+
+    async def _async_probe_camera_urls(self, home_id: str) -> None:
+        """Validate camera urls and call back the cameras whose local url changed."""
+        changed = await self.account.async_update_camera_urls(home_id)
+        if changed and (data_class := self.publisher.get(f"{HOME}-{home_id}")):
+            self._async_notify(data_class, changed)
+
+    @callback
+    def _async_notify(
+        self, data_class: NetatmoPublisher, changed: set[str] | bool
+    ) -> None:
+        """Call the subscribers back, or the ones targeting a changed object."""
+        if changed is True:
+            callbacks = data_class.subscriptions
+        else:
+            callbacks = [
+                update_callback
+                for update_callback in data_class.subscriptions
+                if update_callback not in data_class.targeted
+            ]
+            for target_id in changed & data_class.targets.keys():
+                callbacks.extend(data_class.targets[target_id])
+
+        for update_callback in callbacks:
+            if update_callback:
+                update_callback()
+
+    async def _async_request(
+        self, data_class: NetatmoPublisher
+    ) -> set[str] | bool | None:
+        """
+        Request publisher data.
+
+        Return the ids of the changed modules and rooms of a home, whether
+        the data changed for other publishers, or None if the request
+        timed out. Failed requests changed nothing.
+        """
         try:
-            await getattr(self.account, self.publisher[signal_name].method)(
-                **self.publisher[signal_name].kwargs
+            changed = await getattr(self.account, data_class.method)(
+                **data_class.kwargs
             )
+            if changed and (home_id := data_class.kwargs.get("home_id")):
+                return set(self.account.homes[home_id].changed_ids)
+            return changed
 
         except pyatmo.NoDevice as err:
             _LOGGER.debug(err)
@@ -214,23 +576,64 @@ class NetatmoDataHandler:
 
         except asyncio.TimeoutError as err:
             _LOGGER.debug(err)
+            return None
+
+        return False
+
+    def _async_adapt_interval(
+        self, data_class: NetatmoPublisher, category: NetatmoDeviceCategory
+    ) -> None:
+        """Schedule the next scan shortly after the next expected measurement."""
+        data_times = [
+            module.time_utc
+            for module in self._category_modules(category)
+            if getattr(module, "time_utc", None)
+        ]
+        if not data_times:
             return
 
-        for update_callback in self.publisher[signal_name].subscriptions:
-            if update_callback:
-                update_callback()
+        data_class.learn_cadence(max(data_times))
+
+        if self.interval_stretch() > 1:
+            return
+
+        now = time()
+        data_class.next_scan = now + data_class.adaptive_interval(now)
+        self._schedule(data_class)
+
+    def _category_modules(
+        self, category: NetatmoDeviceCategory
+    ) -> list[pyatmo.modules.Module]:
+        """Return all modules of a device category."""
+        return [
+            module
+            for modules in (
+                self.account.modules,
+                *(home.modules for home in self.account.homes.values()),
+            )
+            for module in modules.values()
+            if module.device_category is category
+        ]
 
     async def subscribe(
         self,
         publisher: str,
         signal_name: str,
         update_callback: CALLBACK_TYPE | None,
+        target_id: str | None = None,
         **kwargs: Any,
     ) -> None:
-        """Subscribe to publisher."""
+        """
+        Subscribe to publisher.
+
+        A subscriber with a target_id is only called back when the module
+        or room with that id changed.
+        """
         if signal_name in self.publisher:
-            if update_callback not in self.publisher[signal_name].subscriptions:
-                self.publisher[signal_name].subscriptions.append(update_callback)
+            data_class = self.publisher[signal_name]
+            if update_callback not in data_class.subscriptions:
+                data_class.subscriptions.append(update_callback)
+                self._add_target(data_class, update_callback, target_id)
             return
 
         if publisher == "public":
@@ -243,7 +646,9 @@ class NetatmoDataHandler:
             subscriptions=[update_callback],
             method=PUBLISHERS[publisher],
             kwargs=kwargs,
+            category=ADAPTIVE_PUBLISHERS.get(publisher),
         )
+        self._add_target(self.publisher[signal_name], update_callback, target_id)
 
         try:
             await self.async_fetch_data(signal_name)
@@ -251,23 +656,51 @@ class NetatmoDataHandler:
             self.publisher.pop(signal_name)
             raise
 
-        self._queue.append(self.publisher[signal_name])
+        self._schedule(self.publisher[signal_name])
         _LOGGER.debug("Publisher %s added", signal_name)
 
     async def unsubscribe(
         self, signal_name: str, update_callback: CALLBACK_TYPE | None
     ) -> None:
         """Unsubscribe from publisher."""
-        if update_callback in self.publisher[signal_name].subscriptions:
+        if update_callback not in self.publisher[signal_name].subscriptions:
             return
 
         self.publisher[signal_name].subscriptions.remove(update_callback)
+        self._remove_target(self.publisher[signal_name], update_callback)
 
         if not self.publisher[signal_name].subscriptions:
-            self._queue.remove(self.publisher[signal_name])
             self.publisher.pop(signal_name)
             _LOGGER.debug("Publisher %s removed", signal_name)
 
+    @staticmethod
+    def _add_target(
+        data_class: NetatmoPublisher,
+        update_callback: CALLBACK_TYPE | None,
+        target_id: str | None,
+    ) -> None:
+        """Index a subscriber by the id of the module or room it represents."""
+        if update_callback is None or target_id is None:
+            return
+
+        data_class.targets.setdefault(target_id, []).append(update_callback)
+        data_class.targeted.add(update_callback)
+
+    @staticmethod
+    def _remove_target(
+        data_class: NetatmoPublisher, update_callback: CALLBACK_TYPE | None
+    ) -> None:
+        """Remove a subscriber from the target index."""
+        if update_callback not in data_class.targeted:
+            return
+
+        data_class.targeted.discard(update_callback)
+        for target_id, callbacks in list(data_class.targets.items()):
+            if update_callback in callbacks:
+                callbacks.remove(update_callback)
+            if not callbacks:
+                data_class.targets.pop(target_id)
+
     @property
     def webhook(self) -> bool:
         """Return the webhook state."""
@@ -281,18 +714,108 @@ class NetatmoDataHandler:
         self.setup_air_care()
 
         for home in self.account.homes.values():
-            signal_home = f"{HOME}-{home.entity_id}"
+            await self.async_setup_home(home)
+
+        self._dispatched = True
+
+    async def async_setup_home(self, home: pyatmo.Home) -> None:
+        """Subscribe to a home and dispatch the creation of its entities."""
+        signal_home = f"{HOME}-{home.entity_id}"
 
-            await self.subscribe(HOME, signal_home, None, home_id=home.entity_id)
-            await self.subscribe(EVENT, signal_home, None, home_id=home.entity_id)
+        await self.subscribe(HOME, signal_home, None, home_id=home.entity_id)
+        await self.subscribe(EVENT, signal_home, None, home_id=home.entity_id)
 
-            self.setup_climate_schedule_select(home, signal_home)
-            self.setup_rooms(home, signal_home)
-            self.setup_modules(home, signal_home)
+        self.setup_climate_schedule_select(home, signal_home)
+        self.setup_rooms(home, signal_home)
+        self.setup_modules(home, signal_home)
 
-            self.hass.data[DOMAIN][DATA_PERSONS][home.entity_id] = {
-                person.entity_id: person.pseudo for person in home.persons.values()
-            }
+        self.hass.data[DOMAIN][DATA_PERSONS][home.entity_id] = {
+            person.entity_id: person.pseudo for person in home.persons.values()
+        }
+
+    @callback
+    def async_handle_topology_changes(self) -> None:
+        """Apply topology changes once the initial entities are set up."""
+        # Changes before the dispatch are covered by the initial entities
+        topology_changes, self.account.topology_changes = (
+            self.account.topology_changes,
+            {},
+        )
+        if self._dispatched and topology_changes:
+            self.hass.async_create_task(
+                self.async_apply_topology_changes(topology_changes)
+            )
+
+    async def async_apply_topology_changes(
+        self, topology_changes: dict[str, pyatmo.TopologyDiff]
+    ) -> None:
+        """Create and remove entities for the objects added to or removed from homes."""
+        for home_id, diff in topology_changes.items():
+            home = self.account.homes[home_id]
+            _LOGGER.debug("Topology of home %s changed: %s", home_id, diff)
+
+            if diff.home_added:
+                await self.async_setup_home(home)
+                continue
+
+            signal_home = f"{HOME}-{home_id}"
+
+            for room_id in diff.rooms_added:
+                self.setup_room(home, home.rooms[room_id], signal_home)
+
+            for module_id in diff.modules_added:
+                module = home.modules[module_id]
+                self.setup_module(home, module, signal_home)
+
+                if (
+                    module.device_category is NetatmoDeviceCategory.climate
+                    and module.room_id in home.rooms
+                    and module.room_id not in diff.rooms_added
+                ):
+                    self.setup_climate_battery(home.rooms[module.room_id], module)
+
+            if (
+                diff.schedules_added or diff.schedules_removed or diff.schedules_renamed
+            ) and home_id in self.hass.data[DOMAIN][DATA_SCHEDULES]:
+                self.hass.data[DOMAIN][DATA_SCHEDULES][home_id] = home.schedules
+
+            if diff.persons_added or diff.persons_removed or diff.persons_renamed:
+                self.hass.data[DOMAIN][DATA_PERSONS][home_id] = {
+                    person.entity_id: person.pseudo for person in home.persons.values()
+                }
+
+            await self.async_update_devices(
+                removed=diff.modules_removed | diff.rooms_removed,
+                renamed={
+                    **{
+                        module_id: home.modules[module_id].name
+                        for module_id in diff.modules_renamed
+                    },
+                    **{
+                        room_id: home.rooms[room_id].name
+                        for room_id in diff.rooms_renamed
+                    },
+                },
+            )
+
+    async def async_update_devices(
+        self, removed: set[str], renamed: dict[str, str]
+    ) -> None:
+        """Remove and rename the devices of removed and renamed objects."""
+        if not removed and not renamed:
+            return
+
+        registry = await self.hass.helpers.device_registry.async_get_registry()
+
+        for object_id in removed:
+            self.hass.data[DOMAIN][DATA_DEVICE_IDS].pop(object_id, None)
+            if device := registry.async_get_device({(DOMAIN, object_id)}):
+                _LOGGER.debug("Removing device %s", object_id)
+                registry.async_remove_device(device.id)
+
+        for object_id, name in renamed.items():
+            if device := registry.async_get_device({(DOMAIN, object_id)}):
+                registry.async_update_device(device.id, name=name)
 
     def setup_favorites(self) -> None:
         """Set up favorites weather modules."""
@@ -326,85 +849,92 @@ class NetatmoDataHandler:
 
     def setup_modules(self, home: pyatmo.Home, signal_home: str) -> None:
         """Set up modules."""
-        netatmo_type_signal_map = {
-            NetatmoDeviceCategory.camera: [
-                NETATMO_CREATE_CAMERA,
-                NETATMO_CREATE_CAMERA_LIGHT,
-            ],
-            NetatmoDeviceCategory.dimmer: [NETATMO_CREATE_LIGHT],
-            NetatmoDeviceCategory.shutter: [NETATMO_CREATE_COVER],
-            NetatmoDeviceCategory.switch: [
-                NETATMO_CREATE_SWITCH,
-                NETATMO_CREATE_SENSOR,
-            ],
-            NetatmoDeviceCategory.meter: [NETATMO_CREATE_SENSOR],
-        }
         for module in home.modules.values():
-            if not module.device_category:
-                continue
+            self.setup_module(home, module, signal_home)
 
-            for signal in netatmo_type_signal_map.get(module.device_category, []):
-                async_dispatcher_send(
-                    self.hass,
-                    signal,
-                    NetatmoDevice(
-                        self,
-                        module,
-                        home.entity_id,
-                        signal_home,
-                    ),
-                )
-            if module.device_category is NetatmoDeviceCategory.weather:
-                async_dispatcher_send(
-                    self.hass,
-                    NETATMO_CREATE_WEATHER_SENSOR,
-                    NetatmoDevice(
-                        self,
-                        module,
-                        home.entity_id,
-                        WEATHER,
-                    ),
-                )
+    def setup_module(
+        self, home: pyatmo.Home, module: pyatmo.modules.Module, signal_home: str
+    ) -> None:
+        """Set up the entities of a module."""
+        if not module.device_category:
+            return
+
+        for signal in NETATMO_TYPE_SIGNAL_MAP.get(module.device_category, []):
+            async_dispatcher_send(
+                self.hass,
+                signal,
+                NetatmoDevice(
+                    self,
+                    module,
+                    home.entity_id,
+                    signal_home,
+                ),
+            )
+        if module.device_category is NetatmoDeviceCategory.weather:
+            async_dispatcher_send(
+                self.hass,
+                NETATMO_CREATE_WEATHER_SENSOR,
+                NetatmoDevice(
+                    self,
+                    module,
+                    home.entity_id,
+                    WEATHER,
+                ),
+            )
 
     def setup_rooms(self, home: pyatmo.Home, signal_home: str) -> None:
         """Set up rooms."""
         for room in home.rooms.values():
-            if NetatmoDeviceCategory.climate in room.features:
-                async_dispatcher_send(
-                    self.hass,
-                    NETATMO_CREATE_CLIMATE,
-                    NetatmoRoom(
-                        self,
-                        room,
-                        home.entity_id,
-                        signal_home,
-                    ),
-                )
+            self.setup_room(home, room, signal_home)
+
+    def setup_room(
+        self, home: pyatmo.Home, room: pyatmo.Room, signal_home: str
+    ) -> None:
+        """Set up the entities of a room."""
+        if NetatmoDeviceCategory.climate not in room.features:
+            return
 
-                for module in room.modules.values():
-                    if module.device_category is NetatmoDeviceCategory.climate:
-                        async_dispatcher_send(
-                            self.hass,
-                            NETATMO_CREATE_BATTERY,
-                            NetatmoDevice(
-                                self,
-                                module,
-                                room.entity_id,
-                                signal_home,
-                            ),
-                        )
-
-                if "humidity" in room.features:
-                    async_dispatcher_send(
-                        self.hass,
-                        NETATMO_CREATE_ROOM_SENSOR,
-                        NetatmoRoom(
-                            self,
-                            room,
-                            room.entity_id,
-                            signal_home,
-                        ),
-                    )
+        async_dispatcher_send(
+            self.hass,
+            NETATMO_CREATE_CLIMATE,
+            NetatmoRoom(
+                self,
+                room,
+                home.entity_id,
+                signal_home,
+            ),
+        )
+
+        for module in room.modules.values():
+            if module.device_category is NetatmoDeviceCategory.climate:
+                self.setup_climate_battery(room, module)
+
+        if "humidity" in room.features:
+            async_dispatcher_send(
+                self.hass,
+                NETATMO_CREATE_ROOM_SENSOR,
+                NetatmoRoom(
+                    self,
+                    room,
+                    room.entity_id,
+                    signal_home,
+                ),
+            )
+
+    def setup_climate_battery(
+        self, room: pyatmo.Room, module: pyatmo.modules.Module
+    ) -> None:
+        """Set up the battery sensor of a climate module."""
+        async_dispatcher_send(
+            self.hass,
+            NETATMO_CREATE_BATTERY,
+            NetatmoDevice(
+                self,
+                module,
+                room.entity_id,
+                f"{HOME}-{room.home.entity_id}",
+            ),
+        )
 
     def setup_climate_schedule_select(
         self, home: pyatmo.Home, signal_home: str
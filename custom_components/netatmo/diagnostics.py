@@ -5,7 +5,14 @@ from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .const import DATA_HANDLER, DOMAIN
+from .const import (
+    AUTH,
+    DATA_HANDLER,
+    DATA_SNAPSHOTS,
+    DATA_WEBHOOK_QUEUE,
+    DATA_WEBHOOK_ROUTER,
+    DOMAIN,
+)
 from .data_handler import ACCOUNT, NetatmoDataHandler
 
 TO_REDACT = {
@@ -35,6 +42,9 @@ async def async_get_config_entry_diagnostics(
     data_handler: NetatmoDataHandler = hass.data[DOMAIN][config_entry.entry_id][
         DATA_HANDLER
     ]
+    rate_budget = hass.data[DOMAIN][config_entry.entry_id][AUTH].rate_budget
+    webhook_queue = hass.data[DOMAIN][DATA_WEBHOOK_QUEUE]
+    snapshots = hass.data[DOMAIN][config_entry.entry_id][DATA_SNAPSHOTS]
 
     return {
         "info": async_redact_data(
@@ -44,6 +54,40 @@ async def async_get_config_entry_diagnostics(
             },
             TO_REDACT,
         ),
+        "scheduler": {
+            "batch_size": data_handler.batch_size,
+            "queue_lag": data_handler.queue_lag(),
+            "interval_stretch": data_handler.interval_stretch(),
+            "coalesced_fetches": data_handler.coalesced_fetches,
+        },
+        "rate_budget": {
+            "remaining": rate_budget.remaining,
+            "granted": {lane.value: n for lane, n in rate_budget.granted.items()},
+            "rejected": {lane.value: n for lane, n in rate_budget.rejected.items()},
+        },
+        "response_digests": {
+            "hits": data_handler.account.digest_hits,
+            "misses": data_handler.account.digest_misses,
+        },
+        "webhook_queue": {
+            "depth": webhook_queue.depth,
+            "processed": webhook_queue.processed,
+            "batches": webhook_queue.batches,
+            "notified": hass.data[DOMAIN][DATA_WEBHOOK_ROUTER].notified,
+            "duplicates": webhook_queue.duplicates,
+            "dropped": webhook_queue.dropped,
+        },
+        "snapshot_cache": {
+            "ttl": snapshots.ttl,
+            "hits": snapshots.hits,
+            "stale_hits": snapshots.stale_hits,
+            "misses": snapshots.misses,
+            "coalesced": snapshots.coalesced,
+            "fetches": snapshots.fetches,
+            "average_latency": snapshots.average_latency,
+            "resizes": snapshots.resizes,
+            "variant_bytes": snapshots.variant_bytes,
+        },
         "data": {
             ACCOUNT: async_redact_data(
                 getattr(data_handler.account, "raw_data"),
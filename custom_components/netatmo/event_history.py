@@ -0,0 +1,236 @@
+"""Persistent history of Netatmo camera events."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import json
+import logging
+import sqlite3
+from threading import Lock
+from time import time
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+_LOGGER = logging.getLogger(__name__)
+
+EVENT_HISTORY_FILE = "netatmo_events.db"
+EVENT_RETENTION = timedelta(days=30)
+FLUSH_INTERVAL = timedelta(seconds=10)
+FLUSH_SIZE = 100
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id TEXT PRIMARY KEY,
+    home_id TEXT NOT NULL,
+    camera_id TEXT NOT NULL,
+    time INTEGER NOT NULL,
+    type TEXT,
+    person_id TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_camera_time ON events (home_id, camera_id, time);
+DROP INDEX IF EXISTS events_type;
+DROP INDEX IF EXISTS events_person;
+"""
+
+
+class EventHistory:
+    """
+    SQLite store of the camera events seen from polls and webhooks.
+
+    Writes are buffered and flushed in batches from the executor, events
+    older than the retention period are pruned.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        path: str,
+        retention: timedelta = EVENT_RETENTION,
+    ) -> None:
+        """Initialize self."""
+        self.hass = hass
+        self.path = path
+        self.retention = retention
+        self._connection: sqlite3.Connection | None = None
+        self._lock = Lock()
+        self._pending: dict[str, tuple] = {}
+        self.camera_homes: dict[str, str] = {}
+        self._unsubs: list[CALLBACK_TYPE] = []
+        self._unsub_stop: CALLBACK_TYPE | None = None
+
+    async def async_setup(self) -> None:
+        """Open the database and schedule flushing and pruning."""
+        await self.hass.async_add_executor_job(self._open)
+        await self.async_prune()
+
+        self._unsubs = [
+            async_track_time_interval(self.hass, self._async_flush, FLUSH_INTERVAL),
+            async_track_time_interval(self.hass, self._async_prune, timedelta(hours=1)),
+        ]
+        self._unsub_stop = self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_close
+        )
+
+    def _open(self) -> None:
+        """Open the database and create the schema."""
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(SCHEMA)
+            self.camera_homes = dict(
+                self._connection.execute(
+                    "SELECT DISTINCT camera_id, home_id FROM events"
+                ).fetchall()
+            )
+
+    @callback
+    def async_add(self, home_id: str, camera_id: str, events: list[dict]) -> None:
+        """Buffer events for the next batched write."""
+        self.camera_homes[camera_id] = home_id
+        for event in events:
+            self._pending[event["entity_id"]] = (
+                event["entity_id"],
+                home_id,
+                camera_id,
+                event["event_time"],
+                event.get("event_type"),
+                event.get("person_id"),
+                json.dumps(event, default=str),
+            )
+
+        if len(self._pending) >= FLUSH_SIZE:
+            self.hass.async_create_task(self.async_flush())
+
+    async def _async_flush(self, now: datetime) -> None:
+        await self.async_flush()
+
+    async def async_flush(self) -> None:
+        """Write the buffered events."""
+        if not self._pending or self._connection is None:
+            return
+
+        rows, self._pending = list(self._pending.values()), {}
+        await self.hass.async_add_executor_job(self._write, rows)
+
+    def _write(self, rows: list[tuple]) -> None:
+        with self._lock:
+            if self._connection is None:
+                return
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+                )
+
+    async def _async_prune(self, now: datetime) -> None:
+        await self.async_prune()
+
+    async def async_prune(self) -> None:
+        """Delete the events older than the retention period."""
+        cutoff = int(time() - self.retention.total_seconds())
+        removed = await self.hass.async_add_executor_job(
+            self._execute, "DELETE FROM events WHERE time < ?", (cutoff,)
+        )
+        _LOGGER.debug("Pruned %s events older than %s", removed, cutoff)
+
+    def _execute(self, query: str, params: tuple = ()) -> int:
+        with self._lock:
+            if self._connection is None:
+                return 0
+            with self._connection:
+                return self._connection.execute(query, params).rowcount
+
+    def _fetch(self, query: str, params: tuple = ()) -> list[sqlite3.Row]:
+        with self._lock:
+            if self._connection is None:
+                return []
+            return self._connection.execute(query, params).fetchall()
+
+    async def async_get_events(
+        self,
+        camera_id: str | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        limit: int = -1,
+        offset: int = 0,
+    ) -> dict[str, dict[int, dict[str, Any]]]:
+        """Return a page of the events of a camera, or of all cameras, newest first."""
+        await self.async_flush()
+
+        query = "SELECT camera_id, time, data FROM events WHERE 1"
+        params: tuple = ()
+        if camera_id is not None:
+            query += " AND home_id = ? AND camera_id = ?"
+            params += (self.camera_homes.get(camera_id), camera_id)
+        if start is not None:
+            query += " AND time >= ?"
+            params += (start,)
+        if end is not None:
+            query += " AND time < ?"
+            params += (end,)
+
+        rows = await self.hass.async_add_executor_job(
+            self._fetch,
+            f"{query} ORDER BY time DESC LIMIT ? OFFSET ?",
+            (*params, limit, offset),
+        )
+
+        events: dict[str, dict[int, dict[str, Any]]] = {}
+        for row in rows:
+            events.setdefault(row["camera_id"], {})[row["time"]] = json.loads(
+                row["data"]
+            )
+        return events
+
+    async def async_get_days(
+        self, camera_id: str, utc_offset: int = 0
+    ) -> list[tuple[int, int]]:
+        """Return the start and event count of the days with events, newest first."""
+        await self.async_flush()
+
+        rows = await self.hass.async_add_executor_job(
+            self._fetch,
+            "SELECT (time + ?) / 86400 AS day, COUNT(*) FROM events"
+            " WHERE home_id = ? AND camera_id = ? GROUP BY day ORDER BY day DESC",
+            (utc_offset, self.camera_homes.get(camera_id), camera_id),
+        )
+        return [(day * 86400 - utc_offset, count) for day, count in rows]
+
+    async def async_get_event(
+        self, camera_id: str, event_time: int
+    ) -> dict[str, Any] | None:
+        """Return an event of a camera."""
+        await self.async_flush()
+
+        rows = await self.hass.async_add_executor_job(
+            self._fetch,
+            "SELECT data FROM events"
+            " WHERE home_id = ? AND camera_id = ? AND time = ? LIMIT 1",
+            (self.camera_homes.get(camera_id), camera_id, event_time),
+        )
+        return json.loads(rows[0]["data"]) if rows else None
+
+    async def _async_close(self, event: Event) -> None:
+        self._unsub_stop = None
+        await self.async_close()
+
+    async def async_close(self) -> None:
+        """Write the buffered events and close the database."""
+        if self._unsub_stop is not None:
+            self._unsubs.append(self._unsub_stop)
+            self._unsub_stop = None
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
+
+        await self.async_flush()
+        await self.hass.async_add_executor_job(self._close)
+
+    def _close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
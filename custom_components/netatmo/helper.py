@@ -2,8 +2,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Any
 from uuid import UUID, uuid4
 
+from .const import DEFAULT_QUALITY
+from .pyatmo.event import Event
+from .pyatmo.modules.module import CameraMixin
+
 
 @dataclass
 class NetatmoArea:
@@ -18,3 +23,22 @@ class NetatmoArea:
     show_on_map: bool
     uuid: UUID = uuid4()
     area_id: str | None = None
+
+
+def event_data(event: Event) -> dict[str, Any]:
+    """Return the attributes of a camera event as a dict."""
+    data = dict(vars(event))
+    data["subevents"] = [
+        dict(vars(subevent))
+        for subevent in data.get("subevents") or []
+        if not isinstance(subevent, dict)
+    ]
+    return data
+
+
+def video_url(
+    camera: CameraMixin, video_id: str, quality: str = DEFAULT_QUALITY
+) -> str:
+    """Return the url of a recording from the current urls of its camera."""
+    base_url = camera.local_url if camera.is_local else camera.vpn_url
+    return f"{base_url}/vod/{video_id}/files/{quality}/index.m3u8"
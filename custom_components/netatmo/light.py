@@ -15,12 +15,9 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .const import (
     CONF_URL_CONTROL,
     CONF_URL_SECURITY,
-    DOMAIN,
     EVENT_TYPE_LIGHT_MODE,
     NETATMO_CREATE_CAMERA_LIGHT,
     NETATMO_CREATE_LIGHT,
-    WEBHOOK_LIGHT_MODE,
-    WEBHOOK_PUSH_TYPE,
 )
 from .data_handler import HOME, SIGNAL_NAME, NetatmoDevice
 from .netatmo_entity_base import NetatmoBase
@@ -91,6 +88,7 @@ class NetatmoCameraLight(NetatmoBase, LightEntity):
                 {
                     "name": HOME,
                     "home_id": self._camera.home.entity_id,
+                    "target_id": self._id,
                     SIGNAL_NAME: self._signal_name,
                 },
             ]
@@ -100,31 +98,15 @@ class NetatmoCameraLight(NetatmoBase, LightEntity):
         """Entity created."""
         await super().async_added_to_hass()
 
-        self.data_handler.config_entry.async_on_unload(
-            async_dispatcher_connect(
-                self.hass,
-                f"signal-{DOMAIN}-webhook-{EVENT_TYPE_LIGHT_MODE}",
-                self.handle_event,
-            )
+        self.async_route_webhook_events(
+            self.handle_event, [EVENT_TYPE_LIGHT_MODE], self._home_id, self._id
         )
 
     @callback
     def handle_event(self, event: dict) -> None:
-        """Handle webhook events."""
-        data = event["data"]
-
-        if not data.get("camera_id"):
-            return
-
-        if (
-            data["home_id"] == self._home_id
-            and data["camera_id"] == self._id
-            and data[WEBHOOK_PUSH_TYPE] == WEBHOOK_LIGHT_MODE
-        ):
-            self._is_on = bool(data["sub_type"] == "on")
-
-            self.async_write_ha_state()
-            return
+        """Handle webhook events once the data handler patched the camera."""
+        self.async_update_callback()
+        self.async_write_ha_state()
 
     @property
     def available(self) -> bool:
@@ -179,6 +161,7 @@ class NetatmoLight(NetatmoBase, LightEntity):
                 {
                     "name": HOME,
                     "home_id": self._dimmer.home.entity_id,
+                    "target_id": self._id,
                     SIGNAL_NAME: self._signal_name,
                 },
             ]
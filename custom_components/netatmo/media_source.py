@@ -1,6 +1,7 @@
 """Netatmo Media Source Implementation."""
 from __future__ import annotations
 
+from collections import OrderedDict
 import datetime as dt
 import logging
 import re
@@ -19,11 +20,23 @@ from homeassistant.components.media_source.models import (
     PlayMedia,
 )
 from homeassistant.core import HomeAssistant, callback
-
-from .const import DATA_CAMERAS, DATA_EVENTS, DOMAIN, MANUFACTURER
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DATA_CAMERAS,
+    DATA_EVENT_HISTORY,
+    DATA_HANDLER,
+    DOMAIN,
+    MANUFACTURER,
+)
+from .helper import event_data, video_url
+from .pyatmo.modules.module import CameraMixin
 
 _LOGGER = logging.getLogger(__name__)
 MIME_TYPE = "application/x-mpegURL"
+PAGE_SIZE = 50
+EVENT_ITEM_CACHE_SIZE = 1000
+HTML_TAGS = re.compile("<.*?>")
 
 
 class IncompatibleMediaSource(MediaSourceError):
@@ -44,133 +57,229 @@ class NetatmoSource(MediaSource):
         """Initialize Netatmo source."""
         super().__init__(DOMAIN)
         self.hass = hass
-        self.events = self.hass.data[DOMAIN][DATA_EVENTS]
+        self._event_items: OrderedDict[
+            tuple[str, int], tuple[str, str | None]
+        ] = OrderedDict()
 
     async def async_resolve_media(self, item: MediaSourceItem) -> PlayMedia:
-        """Resolve media to a url."""
-        _, camera_id, event_id = async_parse_identifier(item)
-        url = self.events[camera_id][event_id]["media_url"]
-        return PlayMedia(url, MIME_TYPE)
+        """Resolve media to a url built from the current camera urls."""
+        _, camera_id, event_id, _, _ = async_parse_identifier(item)
+        if (
+            event_id is None
+            or (event := await self._async_get_event(camera_id, event_id)) is None
+            or not event.get("video_id")
+        ):
+            raise Unresolvable("Event does not exist.")
+        if (camera := self._get_camera(camera_id)) is None:
+            raise Unresolvable("Camera is not available.")
+        return PlayMedia(video_url(camera, event["video_id"]), MIME_TYPE)
+
+    def _get_camera(self, camera_id: str) -> CameraMixin | None:
+        """Return the camera model from the account which has the camera."""
+        for entry_data in self.hass.data[DOMAIN].values():
+            if not isinstance(entry_data, dict) or DATA_HANDLER not in entry_data:
+                continue
+            account = entry_data[DATA_HANDLER].account
+            if (
+                home := account.homes.get(account.device_homes.get(camera_id))
+            ) is not None:
+                return home.modules.get(camera_id)
+        return None
+
+    async def _async_get_event(self, camera_id: str, event_id: int) -> dict | None:
+        """Return an event from the home event index, or from the event history."""
+        if (camera := self._get_camera(camera_id)) is not None:
+            for event in camera.home.events_by_module.get(camera_id, []):
+                if event.event_time == event_id:
+                    return event_data(event)
+
+        return await self.hass.data[DOMAIN][DATA_EVENT_HISTORY].async_get_event(
+            camera_id, event_id
+        )
 
     async def async_browse_media(self, item: MediaSourceItem) -> BrowseMediaSource:
         """Return media."""
         try:
-            source, camera_id, event_id = async_parse_identifier(item)
+            source, camera_id, event_id, day, page = async_parse_identifier(item)
         except Unresolvable as err:
             raise BrowseError(str(err)) from err
 
-        return self._browse_media(source, camera_id, event_id)
+        history = self.hass.data[DOMAIN][DATA_EVENT_HISTORY]
+        cameras = self.hass.data[DOMAIN][DATA_CAMERAS].keys() | history.camera_homes
 
-    def _browse_media(
-        self, source: str, camera_id: str, event_id: int | None
-    ) -> BrowseMediaSource:
-        """Browse media."""
-        if camera_id and camera_id not in self.events:
+        if not camera_id:
+            media = self._build_directory(source, MANUFACTURER)
+            media.children = [
+                self._build_directory(
+                    f"{source}/{cid}",
+                    self.hass.data[DOMAIN][DATA_CAMERAS].get(cid, MANUFACTURER),
+                )
+                for cid in sorted(cameras)
+            ]
+            return media
+
+        if camera_id not in cameras:
             raise BrowseError("Camera does not exist.")
 
-        if event_id and event_id not in self.events[camera_id]:
-            raise BrowseError("Event does not exist.")
+        if event_id is not None:
+            if (event := await self._async_get_event(camera_id, event_id)) is None:
+                raise BrowseError("Event does not exist.")
+            if not event.get("video_id"):
+                _LOGGER.debug(
+                    "Camera %s with event %s without recording found",
+                    camera_id,
+                    event_id,
+                )
+                raise IncompatibleMediaSource
+            return self._build_event(source, camera_id, event_id, event)
+
+        if day is None:
+            return await self._async_build_camera(source, camera_id)
 
-        return self._build_item_response(source, camera_id, event_id)
+        return await self._async_build_day(source, camera_id, day, page)
 
-    def _build_item_response(
-        self, source: str, camera_id: str, event_id: int | None = None
+    async def _async_build_camera(
+        self, source: str, camera_id: str
     ) -> BrowseMediaSource:
-        if event_id and event_id in self.events[camera_id]:
-            created = dt.datetime.fromtimestamp(event_id)
-            if (
-                self.events[camera_id][event_id]["event_type"] == "outdoor"
-                and self.events[camera_id][event_id]["subevents"]
-            ):
-                thumbnail = (
-                    self.events[camera_id][event_id]["subevents"][0]
-                    .get("snapshot", {})
-                    .get("url")
-                )
-                message = remove_html_tags(
-                    self.events[camera_id][event_id]["subevents"][0]["message"]
-                )
-            else:
-                thumbnail = (
-                    self.events[camera_id][event_id].get("snapshot", {}).get("url")
-                )
-                message = remove_html_tags(
-                    self.events[camera_id][event_id].get("message", "empty")
+        """Build a camera folder with a virtual folder per day with events."""
+        offset = dt_util.now().utcoffset() or dt.timedelta()
+        days = await self.hass.data[DOMAIN][DATA_EVENT_HISTORY].async_get_days(
+            camera_id, int(offset.total_seconds())
+        )
+
+        media = self._build_directory(
+            f"{source}/{camera_id}",
+            self.hass.data[DOMAIN][DATA_CAMERAS].get(camera_id, MANUFACTURER),
+        )
+        media.children = []
+        for start, count in days:
+            day = dt_util.as_local(dt_util.utc_from_timestamp(start)).date()
+            media.children.append(
+                self._build_directory(
+                    f"{source}/{camera_id}/{day.isoformat()}",
+                    f"{day.isoformat()} ({count})",
                 )
-            title = f"{created} - {message}"
-        else:
-            title = self.hass.data[DOMAIN][DATA_CAMERAS].get(camera_id, MANUFACTURER)
-            thumbnail = None
+            )
+        return media
 
-        if event_id:
-            path = f"{source}/{camera_id}/{event_id}"
-        else:
-            path = f"{source}/{camera_id}"
+    async def _async_build_day(
+        self, source: str, camera_id: str, day: dt.date, page: int
+    ) -> BrowseMediaSource:
+        """Build a page of the events of a camera on a day."""
+        start = dt_util.start_of_local_day(day)
+        end = dt_util.start_of_local_day(day + dt.timedelta(days=1))
+        events = (
+            await self.hass.data[DOMAIN][DATA_EVENT_HISTORY].async_get_events(
+                camera_id,
+                int(start.timestamp()),
+                int(end.timestamp()),
+                PAGE_SIZE + 1,
+                page * PAGE_SIZE,
+            )
+        ).get(camera_id, {})
+
+        path = f"{source}/{camera_id}/{day.isoformat()}"
+        title = day.isoformat()
+        if page:
+            path, title = f"{path}/{page}", f"{title} ({page + 1})"
+
+        media = self._build_directory(path, title)
+        media.children = [
+            self._build_event(source, camera_id, event_id, event)
+            for event_id, event in list(events.items())[:PAGE_SIZE]
+            if event.get("video_id")
+        ]
+        if len(events) > PAGE_SIZE:
+            media.children.append(
+                self._build_directory(
+                    f"{source}/{camera_id}/{day.isoformat()}/{page + 1}",
+                    f"{day.isoformat()} ({page + 2})",
+                )
+            )
+        return media
 
-        media_class = MEDIA_CLASS_DIRECTORY if event_id is None else MEDIA_CLASS_VIDEO
+    @staticmethod
+    def _build_directory(identifier: str, title: str) -> BrowseMediaSource:
+        """Build a folder whose children are only built when browsed."""
+        return BrowseMediaSource(
+            domain=DOMAIN,
+            identifier=identifier,
+            media_class=MEDIA_CLASS_DIRECTORY,
+            media_content_type=MEDIA_TYPE_VIDEO,
+            title=title,
+            can_play=False,
+            can_expand=True,
+            thumbnail=None,
+        )
 
-        media = BrowseMediaSource(
+    def _build_event(
+        self, source: str, camera_id: str, event_id: int, event: dict
+    ) -> BrowseMediaSource:
+        """Build an event item."""
+        title, thumbnail = self._event_item(camera_id, event_id, event)
+        return BrowseMediaSource(
             domain=DOMAIN,
-            identifier=path,
-            media_class=media_class,
+            identifier=f"{source}/{camera_id}/{event_id}",
+            media_class=MEDIA_CLASS_VIDEO,
             media_content_type=MEDIA_TYPE_VIDEO,
             title=title,
-            can_play=bool(
-                event_id and self.events[camera_id][event_id].get("media_url")
-            ),
-            can_expand=event_id is None,
+            can_play=bool(event.get("video_id")),
+            can_expand=False,
             thumbnail=thumbnail,
         )
 
-        if not media.can_play and not media.can_expand:
-            _LOGGER.debug(
-                "Camera %s with event %s without media url found", camera_id, event_id
-            )
-            raise IncompatibleMediaSource
-
-        if not media.can_expand:
-            return media
-
-        media.children = []
-        # Append first level children
-        if not camera_id:
-            for cid in self.events:
-                child = self._build_item_response(source, cid)
-                if child:
-                    media.children.append(child)
+    def _event_item(
+        self, camera_id: str, event_id: int, event: dict
+    ) -> tuple[str, str | None]:
+        """Return the cached title and thumbnail of an event."""
+        key = (camera_id, event_id)
+        if (item := self._event_items.get(key)) is not None:
+            self._event_items.move_to_end(key)
+            return item
+
+        if event["event_type"] == "outdoor" and event["subevents"]:
+            thumbnail = event["subevents"][0].get("snapshot", {}).get("url")
+            message = remove_html_tags(event["subevents"][0]["message"])
         else:
-            for eid in self.events[camera_id]:
-                try:
-                    child = self._build_item_response(source, camera_id, eid)
-                except IncompatibleMediaSource:
-                    continue
-                if child:
-                    media.children.append(child)
+            thumbnail = (event.get("snapshot") or {}).get("url")
+            message = remove_html_tags(event.get("message") or "empty")
 
-        return media
+        item = self._event_items[key] = (
+            f"{dt.datetime.fromtimestamp(event_id)} - {message}",
+            thumbnail,
+        )
+        if len(self._event_items) > EVENT_ITEM_CACHE_SIZE:
+            self._event_items.popitem(last=False)
+        return item
 
 
 def remove_html_tags(text: str) -> str:
     """Remove html tags from string."""
-    clean = re.compile("<.*?>")
-    return re.sub(clean, "", text)
+    return HTML_TAGS.sub("", text)
 
 
 @callback
 def async_parse_identifier(
     item: MediaSourceItem,
-) -> tuple[str, str, int | None]:
-    """Parse identifier."""
+) -> tuple[str, str, int | None, dt.date | None, int]:
+    """Parse identifier into source, camera, event or day, and page."""
     if not item.identifier or "/" not in item.identifier:
-        return "events", "", None
+        return "events", "", None, None, 0
 
     source, path = item.identifier.lstrip("/").split("/", 1)
 
     if source != "events":
         raise Unresolvable("Unknown source directory.")
 
-    if "/" in path:
-        camera_id, event_id = path.split("/", 1)
-        return source, camera_id, int(event_id)
+    camera_id, _, item_id = path.partition("/")
+    if not item_id:
+        return source, camera_id, None, None, 0
+
+    if item_id.isdigit():
+        return source, camera_id, int(item_id), None, 0
 
-    return source, path, None
+    day, _, page = item_id.partition("/")
+    try:
+        return source, camera_id, None, dt.date.fromisoformat(day), int(page or 0)
+    except ValueError as err:
+        raise Unresolvable("Unknown media item.") from err
@@ -1,6 +1,8 @@
 """Base class for Netatmo entities."""
 from __future__ import annotations
 
+from collections.abc import Callable
+
 from .pyatmo.modules.device_types import (
     DEVICE_DESCRIPTION_MAP,
     DeviceType as NetatmoDeviceType,
@@ -10,7 +12,13 @@ from homeassistant.const import ATTR_ATTRIBUTION
 from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo, Entity
 
-from .const import DATA_DEVICE_IDS, DEFAULT_ATTRIBUTION, DOMAIN, SIGNAL_NAME
+from .const import (
+    DATA_DEVICE_IDS,
+    DATA_WEBHOOK_ROUTER,
+    DEFAULT_ATTRIBUTION,
+    DOMAIN,
+    SIGNAL_NAME,
+)
 from .data_handler import PUBLIC, NetatmoDataHandler
 
 
@@ -40,6 +48,7 @@ class NetatmoBase(Entity):
                     publisher["name"],
                     signal_name,
                     self.async_update_callback,
+                    target_id=publisher.get("target_id"),
                     home_id=publisher["home_id"],
                 )
 
@@ -78,6 +87,21 @@ class NetatmoBase(Entity):
                 publisher[SIGNAL_NAME], self.async_update_callback
             )
 
+    @callback
+    def async_route_webhook_events(
+        self,
+        handler: Callable[[dict], None],
+        event_types: list[str],
+        home_id: str,
+        target_id: str | None = None,
+    ) -> None:
+        """Route the webhook events of a home, room or camera to a handler."""
+        router = self.hass.data[DOMAIN][DATA_WEBHOOK_ROUTER]
+        for event_type in event_types:
+            self.async_on_remove(
+                router.async_register(event_type, home_id, target_id, handler)
+            )
+
     @callback
     def async_update_callback(self) -> None:
         """Update the entity's state."""
@@ -3,8 +3,16 @@ from . import const, modules
 from .account import AsyncAccount
 from .auth import AbstractAsyncAuth, ClientAuth, NetatmoOAuth2
 from .camera import AsyncCameraData, CameraData
-from .exceptions import ApiError, InvalidHome, InvalidRoom, NoDevice, NoSchedule
-from .home import Home
+from .event import EventDelta, EventStore
+from .exceptions import (
+    ApiError,
+    InvalidHome,
+    InvalidRoom,
+    NoDevice,
+    NoSchedule,
+    RateLimitExceeded,
+)
+from .home import Home, TopologyDiff
 from .home_coach import AsyncHomeCoachData, HomeCoachData
 from .modules import Module
 from .modules.device_types import DeviceType
@@ -25,6 +33,8 @@ __all__ = [
     "AsyncWeatherStationData",
     "CameraData",
     "ClientAuth",
+    "EventDelta",
+    "EventStore",
     "HomeCoachData",
     "HomeData",
     "HomeStatus",
@@ -38,6 +48,8 @@ __all__ = [
     "NoDevice",
     "NoSchedule",
     "PublicData",
+    "RateLimitExceeded",
+    "TopologyDiff",
     "WeatherStationData",
     "const",
     "modules",
@@ -1,13 +1,18 @@
 """Support for a Netatmo account."""
 from __future__ import annotations
 
+import asyncio
+from hashlib import blake2b
 import logging
+import re
 from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
 from . import modules
 from .const import (
+    EVENTS,
     GETEVENTS_ENDPOINT,
+    GETEVENTSUNTIL_ENDPOINT,
     GETHOMECOACHDATA_ENDPOINT,
     GETHOMESDATA_ENDPOINT,
     GETHOMESTATUS_ENDPOINT,
@@ -17,15 +22,26 @@ from .const import (
     SETSTATE_ENDPOINT,
     RawData,
 )
+from .event import convert_legacy_event
 from .helpers import extract_raw_data_new
-from .home import Home
-from .modules.module import MeasureInterval, Module
+from .home import Home, TopologyDiff
+from .modules.module import CAMERA_URL_TTL, CameraMixin, MeasureInterval, Module
+from .rate_limit import RequestPriority
 
 if TYPE_CHECKING:
+    from aiohttp import ClientResponse
+
     from .auth import AbstractAsyncAuth
 
 LOG = logging.getLogger(__name__)
 
+# Fetch a full /getevents page after this many incremental event updates,
+# to refresh events older than the cursor, e.g. their video status
+FULL_EVENTS_INTERVAL = 10
+
+# Server timing fields change on every response, even if the data does not
+VOLATILE_FIELDS = re.compile(rb'"time_(?:exec|server)":\s*[0-9.eE+-]+,?')
+
 
 class AsyncAccount:
     """Async class of a Netatmo account."""
@@ -43,6 +59,12 @@ class AsyncAccount:
         self.favorite_stations: bool = favorite_stations
         self.public_weather_areas: dict[str, modules.PublicWeatherArea] = {}
         self.modules: dict[str, Module] = {}
+        self.device_homes: dict[str, str] = {}
+        self.topology_changes: dict[str, TopologyDiff] = {}
+        self.digests: dict[tuple, bytes] = {}
+        self.digest_hits: int = 0
+        self.digest_misses: int = 0
+        self.incremental_event_updates: dict[str, int] = {}
 
     def __repr__(self) -> str:
         return (
@@ -51,52 +73,191 @@ class AsyncAccount:
 
     def process_topology(self) -> None:
         """Process topology information from /homesdata."""
+        self.topology_changes = {}
         for home in self.raw_data["homes"]:
             if (home_id := home["id"]) in self.homes:
-                self.homes[home_id].update_topology(home)
+                diff = self.homes[home_id].update_topology(home)
             else:
                 self.homes[home_id] = Home(self.auth, raw_data=home)
+                diff = TopologyDiff.from_home(self.homes[home_id])
+
+            if diff:
+                self.topology_changes[home_id] = diff
+
+            # Keep the device to home index in sync with the home modules
+            for module_id in diff.modules_removed:
+                if self.device_homes.get(module_id) == home_id:
+                    self.device_homes.pop(module_id)
+            for module_id in diff.modules_added:
+                self.device_homes[module_id] = home_id
+
+    async def _async_response_changed(
+        self,
+        resp: ClientResponse,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+    ) -> bool:
+        """Return whether a response differs from the last one of the request."""
+        content = VOLATILE_FIELDS.sub(b"", await resp.read())
+        digest = blake2b(content, digest_size=16).digest()
+        key = digest_key(endpoint, params)
+
+        if self.digests.get(key) == digest:
+            self.digest_hits += 1
+            return False
+
+        self.digests[key] = digest
+        self.digest_misses += 1
+        return True
+
+    def invalidate_digest(
+        self, endpoint: str, params: dict[str, Any] | None = None
+    ) -> None:
+        """Forget the digest of a request so its next response is processed."""
+        self.digests.pop(digest_key(endpoint, params), None)
+
+    def add_webhook_events(
+        self, home_id: str | None, events: list[RawData]
+    ) -> set[str]:
+        """Add the events of webhook payloads to the event store of a home."""
+        if (home := self.homes.get(home_id)) is None:
+            return set()
+
+        return home.add_webhook_events(events)
 
-    async def async_update_topology(self) -> None:
+    def apply_webhook_events(
+        self, home_id: str | None, events: list[RawData]
+    ) -> set[str] | None:
+        """
+        Apply the state carried by webhook payloads to a home, in order.
+
+        Return the ids of the patched objects, or None if a payload lacks
+        the state needed to patch the home.
+        """
+        if (home := self.homes.get(home_id)) is None:
+            return set()
+
+        changed = home.apply_webhook_events(events)
+
+        # The model no longer matches the last status response
+        if home.changed_ids:
+            self.invalidate_digest(GETHOMESTATUS_ENDPOINT, {"home_id": home_id})
+        return changed
+
+    async def async_update_topology(self) -> bool:
         """Retrieve topology data from /homesdata."""
         resp = await self.auth.async_post_api_request(
             endpoint=GETHOMESDATA_ENDPOINT,
         )
+        if not await self._async_response_changed(resp, GETHOMESDATA_ENDPOINT):
+            return False
+
         self.raw_data = extract_raw_data_new(await resp.json(), "homes")
 
         self.user = self.raw_data.get("user", {}).get("email")
 
         self.process_topology()
+        return True
 
-    async def async_update_status(self, home_id: str) -> None:
+    async def async_update_status(self, home_id: str) -> bool:
         """Retrieve status data from /homestatus."""
         resp = await self.auth.async_post_api_request(
             endpoint=GETHOMESTATUS_ENDPOINT,
             params={"home_id": home_id},
         )
+        if not await self._async_response_changed(
+            resp, GETHOMESTATUS_ENDPOINT, {"home_id": home_id}
+        ):
+            return False
+
         raw_data = extract_raw_data_new(await resp.json(), HOME)
         await self.homes[home_id].update(raw_data)
+        return True
+
+    async def async_update_camera_urls(
+        self, home_id: str, ttl: float = CAMERA_URL_TTL
+    ) -> set[str]:
+        """Validate the expired camera urls of a home concurrently.
+
+        Return the ids of the cameras whose local url changed.
+        """
+        cameras = [
+            module
+            for module in self.homes[home_id].modules.values()
+            if isinstance(module, CameraMixin) and module.camera_urls_expired(ttl)
+        ]
+        local_urls = [camera.local_url for camera in cameras]
+
+        results = await asyncio.gather(
+            *(camera.async_update_camera_urls(ttl) for camera in cameras),
+            return_exceptions=True,
+        )
+        for camera, result in zip(cameras, results):
+            if isinstance(result, Exception):
+                LOG.debug(
+                    "Could not validate urls of camera %s: %s", camera.entity_id, result
+                )
+
+        return {
+            camera.entity_id
+            for camera, local_url in zip(cameras, local_urls)
+            if camera.local_url != local_url
+        }
+
+    async def async_update_events(self, home_id: str) -> bool:
+        """Retrieve events from /getevents, or the newer ones from /geteventsuntil."""
+        updates = self.incremental_event_updates.get(home_id, 0)
+        if (
+            event_id := self.homes[home_id].last_event_id
+        ) is not None and updates < FULL_EVENTS_INTERVAL:
+            self.incremental_event_updates[home_id] = updates + 1
+            return await self._async_update_events_until(home_id, event_id)
+
+        self.incremental_event_updates[home_id] = 0
 
-    async def async_update_events(self, home_id: str) -> None:
-        """Retrieve events from /getevents."""
         resp = await self.auth.async_post_api_request(
             endpoint=GETEVENTS_ENDPOINT,
             params={"home_id": home_id},
         )
+        if not await self._async_response_changed(
+            resp, GETEVENTS_ENDPOINT, {"home_id": home_id}
+        ):
+            return False
+
         raw_data = extract_raw_data_new(await resp.json(), HOME)
         await self.homes[home_id].update(raw_data)
+        return True
+
+    async def _async_update_events_until(self, home_id: str, event_id: str) -> bool:
+        """Retrieve the events newer than the given one from /geteventsuntil."""
+        resp = await self.auth.async_post_api_request(
+            endpoint=GETEVENTSUNTIL_ENDPOINT,
+            params={"home_id": home_id, "event_id": event_id},
+        )
+        if not await self._async_response_changed(
+            resp, GETEVENTSUNTIL_ENDPOINT, {"home_id": home_id}
+        ):
+            return False
+
+        body = (await resp.json()).get("body", {})
+        if "events_list" in body:
+            events = [convert_legacy_event(event) for event in body["events_list"]]
+        else:
+            events = body.get(HOME, {}).get(EVENTS, [])
+        await self.homes[home_id].update({HOME: {EVENTS: events}})
+        return True
 
-    async def async_update_weather_stations(self) -> None:
+    async def async_update_weather_stations(self) -> bool:
         """Retrieve status data from /getstationsdata."""
         params = {"get_favorites": ("true" if self.favorite_stations else "false")}
-        await self._async_update_data(
+        return await self._async_update_data(
             GETSTATIONDATA_ENDPOINT,
             params=params,
         )
 
-    async def async_update_air_care(self) -> None:
+    async def async_update_air_care(self) -> bool:
         """Retrieve status data from /gethomecoachsdata."""
-        await self._async_update_data(GETHOMECOACHDATA_ENDPOINT)
+        return await self._async_update_data(GETHOMECOACHDATA_ENDPOINT)
 
     async def async_update_measures(
         self,
@@ -134,7 +295,7 @@ class AsyncAccount:
         )
         return area_id
 
-    async def async_update_public_weather(self, area_id: str) -> None:
+    async def async_update_public_weather(self, area_id: str) -> bool:
         """Retrieve status data from /getpublicdata"""
         params = {
             "lat_ne": self.public_weather_areas[area_id].location.lat_ne,
@@ -145,7 +306,7 @@ class AsyncAccount:
                 "true" if self.public_weather_areas[area_id].filtering else "false"
             ),
         }
-        await self._async_update_data(
+        return await self._async_update_data(
             GETPUBLIC_DATA_ENDPOINT,
             tag="body",
             params=params,
@@ -158,11 +319,17 @@ class AsyncAccount:
         params: dict[str, Any] | None = None,
         tag: str = "devices",
         area_id: str | None = None,
-    ) -> None:
+    ) -> bool:
         """Retrieve status data from <endpoint>."""
         resp = await self.auth.async_post_api_request(endpoint=endpoint, params=params)
+        if not await self._async_response_changed(
+            resp, endpoint, {**(params or {}), "area_id": area_id}
+        ):
+            return False
+
         raw_data = extract_raw_data_new(await resp.json(), tag)
         await self.update_devices(raw_data, area_id)
+        return True
 
     async def async_set_state(self, home_id: str, data: dict[str, Any]) -> None:
         """Modify device state by passing JSON specific to the device."""
@@ -179,6 +346,7 @@ class AsyncAccount:
         resp = await self.auth.async_post_api_request(
             endpoint=SETSTATE_ENDPOINT,
             params=post_params,
+            priority=RequestPriority.USER,
         )
         LOG.debug("Response: %s", resp)
 
@@ -189,55 +357,45 @@ class AsyncAccount:
     ) -> None:
         """Update device states."""
         for device_data in raw_data.get("devices", {}):
-            if home_id := device_data.get(
-                "home_id",
-                self.find_home_of_device(device_data),
-            ):
-                if home_id not in self.homes:
-                    continue
-                await self.homes[home_id].update(
-                    {HOME: {"modules": [normalize_weather_attributes(device_data)]}},
-                )
-            for module_data in device_data.get("modules", []):
-                await self.update_devices({"devices": [module_data]})
-
-            if (
-                device_data["type"] == "NHC"
-                or self.find_home_of_device(device_data) is None
-            ):
-                device_data["name"] = device_data.get(
-                    "station_name",
-                    device_data.get("module_name", "Unknown"),
-                )
-                device_data = normalize_weather_attributes(device_data)
-                if device_data["id"] not in self.modules:
-                    self.modules[device_data["id"]] = getattr(
-                        modules,
-                        device_data["type"],
-                    )(
-                        home=self,
-                        module=device_data,
-                    )
-                await self.modules[device_data["id"]].update(device_data)
-
-                if device_data.get("modules", []):
-                    self.modules[device_data["id"]].modules = [
-                        module["_id"] for module in device_data["modules"]
-                    ]
+            await self._async_update_device(device_data)
 
         if area_id is not None:
             self.public_weather_areas[area_id].update(raw_data)
 
+    async def _async_update_device(self, device_data: RawData) -> None:
+        """Update a weather device and its modules from their raw data."""
+        device = normalize_weather_attributes(device_data)
+        device_home_id = self.device_homes.get(device["id"])
+
+        if home_id := device.get("home_id", device_home_id):
+            if home_id not in self.homes:
+                return
+            if (module := self.homes[home_id].modules.get(device["id"])) is not None:
+                await module.update(device)
+
+        for module_data in device_data.get("modules", []):
+            await self._async_update_device(module_data)
+
+        if device["type"] == "NHC" or device_home_id is None:
+            device["name"] = device_data.get(
+                "station_name",
+                device_data.get("module_name", "Unknown"),
+            )
+            if (module := self.modules.get(device["id"])) is None:
+                module = self.modules[device["id"]] = getattr(modules, device["type"],)(
+                    home=self,
+                    module=device,
+                )
+            await module.update(device)
+
+            if device_data.get("modules", []):
+                module.modules = [
+                    module_data["_id"] for module_data in device_data["modules"]
+                ]
+
     def find_home_of_device(self, device_data: dict[str, Any]) -> str | None:
         """Find home_id of device."""
-        return next(
-            (
-                home_id
-                for home_id, home in self.homes.items()
-                if device_data["_id"] in home.modules
-            ),
-            None,
-        )
+        return self.device_homes.get(device_data["_id"])
 
 
 ATTRIBUTES_TO_FIX = {
@@ -259,12 +417,18 @@ ATTRIBUTES_TO_FIX = {
 }
 
 
+def digest_key(endpoint: str, params: dict[str, Any] | None = None) -> tuple:
+    """Return the response digest key of a request."""
+    return (endpoint, *sorted((params or {}).items()))
+
+
 def normalize_weather_attributes(raw_data: RawData) -> dict[str, Any]:
-    """Normalize weather attributes."""
+    """Normalize weather attributes, flattening dashboard_data in one pass."""
     result: dict[str, Any] = {}
     for attribute, value in raw_data.items():
         if attribute == "dashboard_data":
-            result.update(**normalize_weather_attributes(value))
+            for key, val in value.items():
+                result[ATTRIBUTES_TO_FIX.get(key, key)] = val
         else:
             result[ATTRIBUTES_TO_FIX.get(attribute, attribute)] = value
     return result
@@ -20,10 +20,12 @@ from .const import (
     AUTHORIZATION_HEADER,
     DEFAULT_BASE_URL,
     ERRORS,
+    USAGE_REACHED_ERROR_CODE,
     WEBHOOK_URL_ADD_ENDPOINT,
     WEBHOOK_URL_DROP_ENDPOINT,
 )
 from .exceptions import ApiError
+from .rate_limit import RateBudget, RequestPriority
 
 LOG = logging.getLogger(__name__)
 
@@ -301,6 +303,7 @@ class AbstractAsyncAuth(ABC):
         """Initialize the auth."""
         self.websession = websession
         self.base_url = base_url
+        self.rate_budget = RateBudget()
 
     @abstractmethod
     async def async_get_access_token(self) -> str:
@@ -312,8 +315,12 @@ class AbstractAsyncAuth(ABC):
         base_url: str | None = None,
         params: dict[str, Any] | None = None,
         timeout: int = 5,
+        priority: RequestPriority = RequestPriority.BACKGROUND,
     ) -> bytes:
         """Wrapper for async get requests."""
+        url = (base_url or self.base_url) + endpoint
+        await self._async_acquire_budget(url, priority)
+
         try:
             access_token = await self.async_get_access_token()
         except ClientError as err:
@@ -322,7 +329,6 @@ class AbstractAsyncAuth(ABC):
 
         req_args = {"data": params if params is not None else {}}
 
-        url = (base_url or self.base_url) + endpoint
         async with self.websession.get(
             url,
             **req_args,  # type: ignore
@@ -347,20 +353,31 @@ class AbstractAsyncAuth(ABC):
         base_url: str | None = None,
         params: dict[str, Any] | None = None,
         timeout: int = 5,
+        priority: RequestPriority = RequestPriority.BACKGROUND,
     ) -> ClientResponse:
         return await self.async_post_request(
             url=(base_url or self.base_url) + endpoint,
             params=params,
             timeout=timeout,
+            priority=priority,
         )
 
+    async def _async_acquire_budget(self, url: str, priority: RequestPriority) -> None:
+        """Account a request against the API rate budget."""
+        # Requests to the cameras themselves do not count against the quotas
+        if url.startswith(self.base_url):
+            await self.rate_budget.async_acquire(priority)
+
     async def async_post_request(
         self,
         url: str,
         params: dict[str, Any] | None = None,
         timeout: int = 5,
+        priority: RequestPriority = RequestPriority.BACKGROUND,
     ) -> ClientResponse:
         """Wrapper for async post requests."""
+        await self._async_acquire_budget(url, priority)
+
         try:
             access_token = await self.async_get_access_token()
         except ClientError as err:
@@ -386,6 +403,8 @@ class AbstractAsyncAuth(ABC):
                 LOG.debug("The Netatmo API returned %s (%s)", resp_content, resp_status)
                 try:
                     resp_json = await resp.json()
+                    if resp_json["error"]["code"] == USAGE_REACHED_ERROR_CODE:
+                        self.rate_budget.drain()
                     raise ApiError(
                         f"{resp_status} - "
                         f"{ERRORS.get(resp_status, '')} - "
@@ -419,6 +438,7 @@ class AbstractAsyncAuth(ABC):
             resp = await self.async_post_api_request(
                 endpoint=WEBHOOK_URL_ADD_ENDPOINT,
                 params={"url": webhook_url},
+                priority=RequestPriority.USER,
             )
         except asyncio.exceptions.TimeoutError as exc:
             raise ApiError("Webhook registration timed out") from exc
@@ -431,6 +451,7 @@ class AbstractAsyncAuth(ABC):
             resp = await self.async_post_api_request(
                 endpoint=WEBHOOK_URL_DROP_ENDPOINT,
                 params={"app_types": "app_security"},
+                priority=RequestPriority.USER,
             )
         except asyncio.exceptions.TimeoutError as exc:
             raise ApiError("Webhook registration timed out") from exc
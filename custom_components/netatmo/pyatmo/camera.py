@@ -1,7 +1,6 @@
 """Support for Netatmo security devices (cameras, smoke detectors, sirens, window sensors, events and persons)."""
 from __future__ import annotations
 
-import imghdr
 import time
 from abc import ABC
 from collections import defaultdict
@@ -21,7 +20,7 @@ from .const import (
     SETSTATE_ENDPOINT,
 )
 from .exceptions import ApiError, NoDevice
-from .helpers import LOG, extract_raw_data
+from .helpers import LOG, extract_raw_data, image_type
 
 warn(f"The module {__name__} is deprecated.", DeprecationWarning, stacklevel=2)
 
@@ -586,8 +585,7 @@ class CameraData(AbstractCameraData):
             endpoint=GETCAMERAPICTURE_ENDPOINT,
             params=post_params,
         ).content
-        image_type = imghdr.what("NONE.FILE", resp)
-        return resp, image_type
+        return resp, image_type(resp)
 
     def get_profile_image(
         self,
@@ -811,7 +809,7 @@ class AsyncCameraData(AbstractCameraData):
         if not isinstance(resp, bytes):
             return b"", None
 
-        return resp, imghdr.what("NONE.FILE", resp)
+        return resp, image_type(resp)
 
     async def async_get_profile_image(
         self,
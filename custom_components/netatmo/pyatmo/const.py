@@ -14,6 +14,9 @@ ERRORS: dict[int, str] = {
     503: "Service Unavailable",
 }
 
+# API error code returned once a request quota is used up
+USAGE_REACHED_ERROR_CODE = 26
+
 # Special types
 RawData = Dict[str, Any]
 
@@ -78,6 +81,10 @@ ALL_SCOPES = [
 MANUAL = "manual"
 HOME = "home"
 FROSTGUARD = "hg"
+AWAY = "away"
+OFF = "off"
+MAX = "max"
+MAX_TEMP = 30
 SCHEDULES = "schedules"
 EVENTS = "events"
 
@@ -1,13 +1,20 @@
 """Module to represent a Netatmo event."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import bisect
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
 from enum import Enum
+import time
 
-from .const import RawData
+from .const import DEFAULT_BASE_URL, GETCAMERAPICTURE_ENDPOINT, RawData
 
 EVENT_ATTRIBUTES_MAP = {"id": "entity_id", "type": "event_type", "time": "event_time"}
 
+MAX_EVENTS = 200
+MAX_EVENT_AGE = 7 * 24 * 3600
+
 
 class EventTypes(Enum):
     """Event types."""
@@ -103,3 +110,154 @@ class Event:
             if attrib == "subevents":
                 value = [Event(self.home_id, event) for event in value]
             setattr(self, EVENT_ATTRIBUTES_MAP.get(attrib, attrib), value)
+
+
+def convert_legacy_snapshot(snapshot: RawData | None) -> RawData | None:
+    """Add the picture url to a legacy snapshot, which only has an id and key."""
+    if not snapshot or "url" in snapshot or not {"id", "key"} <= snapshot.keys():
+        return snapshot
+
+    return {
+        **snapshot,
+        "url": (
+            f"{DEFAULT_BASE_URL}{GETCAMERAPICTURE_ENDPOINT}"
+            f"?image_id={snapshot['id']}&key={snapshot['key']}"
+        ),
+    }
+
+
+def convert_legacy_event(raw_event: RawData) -> RawData:
+    """Convert an event of the legacy /geteventsuntil to the /getevents format."""
+    event = {
+        key: value
+        for key, value in raw_event.items()
+        if key not in ("camera_id", "event_list", "snapshot", "vignette")
+    }
+
+    if module_id := raw_event.get("module_id") or raw_event.get("camera_id"):
+        event["module_id"] = module_id
+    for key in ("snapshot", "vignette"):
+        if key in raw_event:
+            event[key] = convert_legacy_snapshot(raw_event[key])
+    if "event_list" in raw_event:
+        event["subevents"] = [
+            convert_legacy_event(subevent) for subevent in raw_event["event_list"]
+        ]
+
+    return event
+
+
+@dataclass
+class EventDelta:
+    """Events added or updated, and events removed from an event store."""
+
+    changed: list[Event] = field(default_factory=list)
+    removed: list[Event] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.changed or self.removed)
+
+
+class EventStore(Mapping):
+    """
+    Events of a home keyed by id and ordered by event time.
+
+    Events older than max_age or beyond the newest max_events are evicted.
+    Every change bumps the store revision, so consumers can ask for the
+    changes since the revision they last saw.
+    """
+
+    def __init__(
+        self,
+        home_id: str,
+        max_events: int = MAX_EVENTS,
+        max_age: int = MAX_EVENT_AGE,
+    ) -> None:
+        self.home_id = home_id
+        self.max_events = max_events
+        self.max_age = max_age
+        self.revision = 0
+        self._events: dict[str, Event] = {}
+        self._raw: dict[str, RawData] = {}
+        self._revisions: dict[str, int] = {}
+        self._order: list[tuple[int, str]] = []
+        self._removed: deque[tuple[int, Event]] = deque(maxlen=max_events)
+
+    def __getitem__(self, event_id: str) -> Event:
+        return self._events[event_id]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the event ids, newest first."""
+        return (event_id for _, event_id in reversed(self._order))
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def merge(
+        self, raw_events: Iterable[RawData], now: float | None = None
+    ) -> EventDelta:
+        """Merge raw events, only building the ones which are new or changed."""
+        delta = EventDelta()
+
+        for raw_event in raw_events:
+            event_id = raw_event["id"]
+            if self._raw.get(event_id) == raw_event:
+                continue
+
+            if (old := self._events.get(event_id)) is not None:
+                self._order.remove((old.event_time, event_id))
+
+            event = Event(home_id=self.home_id, raw_data=raw_event)
+            self._events[event_id] = event
+            self._raw[event_id] = raw_event
+            self.revision += 1
+            self._revisions[event_id] = self.revision
+            bisect.insort(self._order, (event.event_time, event_id))
+            delta.changed.append(event)
+
+        delta.removed = self._evict(time.time() if now is None else now)
+        if delta.removed:
+            delta.changed = [
+                event for event in delta.changed if event.entity_id in self._events
+            ]
+
+        return delta
+
+    def _evict(self, now: float) -> list[Event]:
+        """Drop the events beyond the count cap or older than the age cap."""
+        removed = []
+        while self._order and (
+            len(self._order) > self.max_events or self._order[0][0] < now - self.max_age
+        ):
+            _, event_id = self._order.pop(0)
+            event = self._events.pop(event_id)
+            self._raw.pop(event_id)
+            self._revisions.pop(event_id)
+            self.revision += 1
+            self._removed.append((self.revision, event))
+            removed.append(event)
+
+        return removed
+
+    def changes_since(self, revision: int) -> EventDelta | None:
+        """
+        Return the changes since a revision.
+
+        Return None if removals that old were forgotten, so the consumer
+        has to start over from the full store.
+        """
+        if (
+            self._removed
+            and len(self._removed) == self._removed.maxlen
+            and self._removed[0][0] > revision + 1
+        ):
+            return None
+
+        return EventDelta(
+            changed=[
+                self._events[event_id]
+                for event_id in self
+                if self._revisions[event_id] > revision
+            ],
+            removed=[event for rev, event in self._removed if rev > revision],
+        )
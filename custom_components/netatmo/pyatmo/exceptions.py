@@ -23,3 +23,7 @@ class ApiError(Exception):
 
 class InvalidState(Exception):
     pass
+
+
+class RateLimitExceeded(ApiError):
+    pass
@@ -26,6 +26,15 @@ def today_stamps() -> tuple[int, int]:
     return today, today + 3600 * 24
 
 
+def image_type(data: bytes) -> str | None:
+    """Return the type of a JPEG or PNG image from its magic bytes."""
+    if data[:3] == b"\xff\xd8\xff":
+        return "jpeg"
+    if data[:8] == b"\x89PNG\r\n\x1a\n":
+        return "png"
+    return None
+
+
 def fix_id(raw_data: RawData) -> dict[str, Any]:
     """Fix known errors in station ids like superfluous spaces."""
     if not raw_data:
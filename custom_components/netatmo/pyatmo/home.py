@@ -2,13 +2,21 @@
 from __future__ import annotations
 
 import logging
+import sys
+import time
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from aiohttp import ClientResponse
 
 from . import modules
 from .const import (
+    AWAY,
     EVENTS,
+    FROSTGUARD,
+    MAX,
+    MAX_TEMP,
+    OFF,
     SCHEDULES,
     SETPERSONSAWAY_ENDPOINT,
     SETPERSONSHOME_ENDPOINT,
@@ -17,9 +25,10 @@ from .const import (
     SWITCHHOMESCHEDULE_ENDPOINT,
     RawData,
 )
-from .event import Event
+from .event import Event, EventStore
 from .exceptions import InvalidState, NoSchedule
 from .person import Person
+from .rate_limit import RequestPriority
 from .room import Room
 from .schedule import Schedule
 
@@ -29,6 +38,56 @@ if TYPE_CHECKING:
 LOG = logging.getLogger(__name__)
 
 
+@dataclass
+class TopologyDiff:
+    """Objects added, removed or renamed by a topology update of a home."""
+
+    home_added: bool = False
+    modules_added: set[str] = field(default_factory=set)
+    modules_removed: set[str] = field(default_factory=set)
+    modules_renamed: set[str] = field(default_factory=set)
+    rooms_added: set[str] = field(default_factory=set)
+    rooms_removed: set[str] = field(default_factory=set)
+    rooms_renamed: set[str] = field(default_factory=set)
+    schedules_added: set[str] = field(default_factory=set)
+    schedules_removed: set[str] = field(default_factory=set)
+    schedules_renamed: set[str] = field(default_factory=set)
+    persons_added: set[str] = field(default_factory=set)
+    persons_removed: set[str] = field(default_factory=set)
+    persons_renamed: set[str] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        return any(vars(self).values())
+
+    @classmethod
+    def from_home(cls, home: Home) -> TopologyDiff:
+        """Return the diff of a home which was just added."""
+        return cls(
+            home_added=True,
+            modules_added=set(home.modules),
+            rooms_added=set(home.rooms),
+            schedules_added=set(home.schedules),
+            persons_added=set(home.persons),
+        )
+
+
+def event_module_id(event: Event) -> str | None:
+    """Return the id of the module an event belongs to."""
+    return getattr(event, "module_id", None) or event.camera_id
+
+
+def diff_names(
+    old: dict[str, str | None],
+    new: dict[str, str | None],
+) -> tuple[set[str], set[str], set[str]]:
+    """Return the added, removed and renamed ids between two id to name maps."""
+    return (
+        new.keys() - old.keys(),
+        old.keys() - new.keys(),
+        {key for key in old.keys() & new.keys() if old[key] != new[key]},
+    )
+
+
 class Home:
     """Class to represent a Netatmo home."""
 
@@ -39,14 +98,18 @@ class Home:
     modules: dict[str, modules.Module]
     schedules: dict[str, Schedule]
     persons: dict[str, Person]
-    events: dict[str, Event]
+    events: EventStore
+    events_by_module: dict[str, list[Event]]
+    last_event_id: str | None
+    last_event_time: int
+    changed_ids: set[str]
 
     def __init__(self, auth: AbstractAsyncAuth, raw_data: RawData) -> None:
         self.auth = auth
         self.entity_id = raw_data["id"]
         self.name = raw_data.get("name", "Unknown")
         self.modules = {
-            module["id"]: getattr(modules, module["type"])(
+            sys.intern(module["id"]): getattr(modules, module["type"])(
                 home=self,
                 module=module,
             )
@@ -67,14 +130,24 @@ class Home:
         self.persons = {
             s["id"]: Person(home=self, raw_data=s) for s in raw_data.get("persons", [])
         }
-        self.events = {}
+        self.events = EventStore(self.entity_id)
+        self.events_by_module = {}
+        self.last_event_id = None
+        self.last_event_time = 0
+        self.changed_ids = set()
+
+    def update_topology(self, raw_data: RawData) -> TopologyDiff:
+        """Update the topology and return what changed."""
+        module_names = {key: module.name for key, module in self.modules.items()}
+        room_names = {key: room.name for key, room in self.rooms.items()}
+        schedule_names = {key: sched.name for key, sched in self.schedules.items()}
+        person_names = {key: person.pseudo for key, person in self.persons.items()}
 
-    def update_topology(self, raw_data: RawData) -> None:
         self.name = raw_data.get("name", "Unknown")
 
         raw_modules = raw_data.get("modules", [])
         for module in raw_modules:
-            if (module_id := module["id"]) not in self.modules:
+            if (module_id := sys.intern(module["id"])) not in self.modules:
                 self.modules[module_id] = getattr(modules, module["type"])(
                     home=self,
                     module=module,
@@ -105,8 +178,37 @@ class Home:
             s["id"]: Schedule(home=self, raw_data=s)
             for s in raw_data.get(SCHEDULES, [])
         }
+        self.persons = {
+            s["id"]: Person(home=self, raw_data=s) for s in raw_data.get("persons", [])
+        }
+
+        diff = TopologyDiff()
+        (diff.modules_added, diff.modules_removed, diff.modules_renamed,) = diff_names(
+            module_names,
+            {key: module.name for key, module in self.modules.items()},
+        )
+        diff.rooms_added, diff.rooms_removed, diff.rooms_renamed = diff_names(
+            room_names,
+            {key: room.name for key, room in self.rooms.items()},
+        )
+        (
+            diff.schedules_added,
+            diff.schedules_removed,
+            diff.schedules_renamed,
+        ) = diff_names(
+            schedule_names,
+            {key: sched.name for key, sched in self.schedules.items()},
+        )
+        (diff.persons_added, diff.persons_removed, diff.persons_renamed,) = diff_names(
+            person_names,
+            {key: person.pseudo for key, person in self.persons.items()},
+        )
+        return diff
 
     async def update(self, raw_data: RawData) -> None:
+        for entity in (*self.modules.values(), *self.rooms.values()):
+            entity.changes = {}
+
         for module in raw_data.get("errors", []):
             await self.modules[module["id"]].update({})
 
@@ -118,21 +220,165 @@ class Home:
         for room in data.get("rooms", []):
             self.rooms[room["id"]].update(room)
 
-        self.events = {
-            s["id"]: Event(home_id=self.entity_id, raw_data=s)
-            for s in data.get(EVENTS, [])
+        if EVENTS in data:
+            self.merge_events(data[EVENTS])
+
+        self.changed_ids = {
+            entity_id
+            for entities in (self.modules, self.rooms)
+            for entity_id, entity in entities.items()
+            if entity.changes
         }
+
+    def merge_events(
+        self,
+        raw_events: list[RawData],
+        advance_cursor: bool = True,
+    ) -> set[str]:
+        """
+        Merge events into the event store.
+
+        Return the ids of the modules whose events changed. The cursor
+        follows the newest event returned by the API.
+        """
+        if advance_cursor:
+            for raw_event in raw_events:
+                if raw_event.get("time", 0) >= self.last_event_time:
+                    self.last_event_id = raw_event["id"]
+                    self.last_event_time = raw_event.get("time", 0)
+
+        if not (delta := self.events.merge(raw_events)):
+            return set()
+
+        changed = {event_module_id(event) for event in (*delta.changed, *delta.removed)}
+        events_by_module: dict[str | None, list[Event]] = {
+            module_id: [] for module_id in changed
+        }
+        for event in self.events.values():
+            if (module_id := event_module_id(event)) in events_by_module:
+                events_by_module[module_id].append(event)
+        self.events_by_module.update(events_by_module)
+
+        for module_id in changed:
+            if hasattr(module := self.modules.get(module_id), "events"):
+                old_events = getattr(module, "events")
+                module.changes["events"] = (old_events, events_by_module[module_id])
+                setattr(module, "events", events_by_module[module_id])
+
+        return changed & self.modules.keys()
+
+    def add_webhook_events(self, events: list[RawData]) -> set[str]:
+        """
+        Add the events of webhook payloads to the event store.
+
+        Return the ids of the modules whose events changed. The events are
+        replaced with their full details on the next event update.
+        """
+        raw_events = [
+            {
+                "id": event_id,
+                "type": data.get("event_type"),
+                "time": data.get("time", int(time.time())),
+                "module_id": data.get("camera_id") or data.get("device_id"),
+                "message": data.get("message"),
+            }
+            for data in events
+            if (event_id := data.get("event_id")) and event_id not in self.events
+        ]
+        if not raw_events:
+            return set()
+
         for module in self.modules.values():
-            if hasattr(module, "events"):
-                setattr(
-                    module,
-                    "events",
-                    [
-                        event
-                        for event in self.events.values()
-                        if getattr(event, "module_id") == module.entity_id
-                    ],
+            module.changes = {}
+
+        return self.merge_events(raw_events, advance_cursor=False)
+
+    def apply_webhook_events(self, events: list[RawData]) -> set[str] | None:
+        """
+        Apply the state carried by webhook payloads to the home, in order.
+
+        Return the ids of the patched modules, rooms and schedules, or None
+        if a payload lacks the state needed to patch the home.
+        """
+        self.changed_ids = set()
+        complete = True
+        for data in events:
+            if (patches := self._webhook_patches(data)) is None:
+                complete = False
+                continue
+
+            for entity_id, values in patches.items():
+                entity = (
+                    self.modules.get(entity_id)
+                    or self.rooms.get(entity_id)
+                    or self.schedules.get(entity_id)
                 )
+                if entity is None:
+                    continue
+
+                if entity_id not in self.changed_ids:
+                    entity.changes = {}
+                for key, val in values.items():
+                    if hasattr(entity, key) and (old := getattr(entity, key)) != val:
+                        entity.changes[key] = (old, val)
+                        setattr(entity, key, val)
+
+                if entity.changes:
+                    self.changed_ids.add(entity_id)
+
+        return self.changed_ids if complete else None
+
+    def _webhook_patches(self, data: RawData) -> dict[str, RawData] | None:
+        """Return the values a webhook payload sets, by module, room or schedule."""
+        event_type = data.get("event_type")
+        home = data.get("home", {})
+
+        if event_type in {"on", "off"}:
+            return {data.get("camera_id"): {"monitoring": event_type == "on"}}
+
+        if event_type == "light_mode":
+            return {data.get("camera_id"): {"floodlight": data.get("sub_type")}}
+
+        if event_type == "set_point":
+            patches: dict[str, RawData] = {}
+            for room in home.get("rooms", []):
+                values = {
+                    key: room[key]
+                    for key in ("therm_setpoint_mode", "therm_setpoint_temperature")
+                    if key in room
+                }
+                # Off and max set points come without a temperature
+                if (mode := room.get("therm_setpoint_mode")) in {OFF, MAX}:
+                    values["therm_setpoint_temperature"] = (
+                        0 if mode == OFF else MAX_TEMP
+                    )
+                patches[room["id"]] = values
+            return patches
+
+        if event_type == "therm_mode" and home.get("therm_mode") in {
+            FROSTGUARD,
+            AWAY,
+        }:
+            mode = home["therm_mode"]
+            temperature = (
+                self.get_hg_temp() if mode == FROSTGUARD else self.get_away_temp()
+            )
+            return {
+                room_id: {
+                    "therm_setpoint_mode": mode,
+                    "therm_setpoint_temperature": temperature,
+                }
+                for room_id in self.rooms
+            }
+
+        if event_type == "schedule" and data.get("schedule_id") in self.schedules:
+            return {
+                schedule_id: {"selected": schedule_id == data["schedule_id"]}
+                for schedule_id in self.schedules
+            }
+
+        # Scheduled set points are not part of the payload
+        return None
 
     def get_selected_schedule(self) -> Schedule | None:
         """Return selected schedule for given home."""
@@ -189,6 +435,7 @@ class Home:
         resp = await self.auth.async_post_api_request(
             endpoint=SETTHERMMODE_ENDPOINT,
             params=post_params,
+            priority=RequestPriority.USER,
         )
 
         if (await resp.json()).get("status") == "ok":
@@ -205,6 +452,7 @@ class Home:
         resp = await self.auth.async_post_api_request(
             endpoint=SWITCHHOMESCHEDULE_ENDPOINT,
             params={"home_id": self.entity_id, "schedule_id": schedule_id},
+            priority=RequestPriority.USER,
         )
 
         if (await resp.json()).get("status") == "ok":
@@ -222,6 +470,7 @@ class Home:
         resp = await self.auth.async_post_api_request(
             endpoint=SETSTATE_ENDPOINT,
             params={"json": {"home": {"id": self.entity_id, **data}}},
+            priority=RequestPriority.USER,
         )
 
         if (await resp.json()).get("status") == "ok":
@@ -240,6 +489,7 @@ class Home:
         return await self.auth.async_post_api_request(
             endpoint=SETPERSONSHOME_ENDPOINT,
             params=post_params,
+            priority=RequestPriority.USER,
         )
 
     async def async_set_persons_away(
@@ -253,6 +503,7 @@ class Home:
         return await self.auth.async_post_api_request(
             endpoint=SETPERSONSAWAY_ENDPOINT,
             params=post_params,
+            priority=RequestPriority.USER,
         )
 
 
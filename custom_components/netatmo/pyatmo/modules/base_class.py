@@ -4,46 +4,95 @@ from __future__ import annotations
 import logging
 from abc import ABC
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Iterable
+from functools import lru_cache
+import sys
+from typing import TYPE_CHECKING, AbstractSet, Any, Callable, Iterable
 
 from ..const import RawData
 from ..modules.device_types import DeviceType
 
 if TYPE_CHECKING:
-    from ..event import EventTypes
     from ..home import Home
 
 LOG = logging.getLogger(__name__)
 
 
-NETATMO_ATTRIBUTES_MAP = {
-    "entity_id": lambda x, y: x.get("id", y),
-    "modules": lambda x, y: x.get("modules_bridged", y),
-    "device_type": lambda x, y: DeviceType(x.get("type", y)),
-    "event_type": lambda x, y: EventTypes(x.get("type", y)),
-    "reachable": lambda x, _: x.get("reachable", False),
-    "monitoring": lambda x, _: x.get("monitoring", False) == "on",
-    "battery_level": lambda x, y: x.get("battery_vp", x.get("battery_level")),
-    "place": lambda x, _: Place(x.get("place")),
+@lru_cache(maxsize=None)
+def device_type(value: str) -> DeviceType:
+    """Return the cached device type of a raw type value."""
+    return DeviceType(value)
+
+
+# Attributes read from a differently named raw key, only if present
+RENAMED_ATTRIBUTES: dict[str, tuple[str, Callable[[Any], Any]]] = {
+    "entity_id": ("id", lambda x: x),
+    "modules": ("modules_bridged", lambda x: x),
+    "device_type": ("type", device_type),
+}
+
+# Attributes derived from the raw data whether or not their key is present
+DERIVED_ATTRIBUTES: dict[str, Callable[[RawData], Any]] = {
+    "reachable": lambda x: x.get("reachable", False),
+    "monitoring": lambda x: x.get("monitoring", False) == "on",
+    "battery_level": lambda x: x.get("battery_vp", x.get("battery_level")),
+    "place": lambda x: Place(x.get("place")),
 }
 
 
-def default(key: str, val: Any) -> Any:
-    return lambda x, _: x.get(key, val)
+class AttributeUpdater:
+    """Apply raw data to the attributes of an entity class."""
+
+    def __init__(self, keys: Iterable[str]) -> None:
+        self.keys = frozenset(keys)
+        attributes = self.keys - {"changes"}
+        self.plain = frozenset(
+            attributes - RENAMED_ATTRIBUTES.keys() - DERIVED_ATTRIBUTES.keys(),
+        )
+        self.renamed = tuple(
+            (attribute, *RENAMED_ATTRIBUTES[attribute])
+            for attribute in attributes & RENAMED_ATTRIBUTES.keys()
+        )
+        self.derived = tuple(
+            (attribute, DERIVED_ATTRIBUTES[attribute])
+            for attribute in attributes & DERIVED_ATTRIBUTES.keys()
+        )
+
+    def apply(self, entity: NetatmoBase, raw_data: RawData) -> None:
+        """Update the attributes of an entity and record its changes."""
+        changes = entity.changes
+
+        for key in self.plain & raw_data.keys():
+            if (value := raw_data[key]) != (old := getattr(entity, key)):
+                changes[key] = (old, value)
+                setattr(entity, key, value)
+
+        for key, raw_key, convert in self.renamed:
+            if raw_key in raw_data:
+                value = convert(raw_data[raw_key])
+                if value != (old := getattr(entity, key)):
+                    changes[key] = (old, value)
+                    setattr(entity, key, value)
+
+        for key, derive in self.derived:
+            if (value := derive(raw_data)) != (old := getattr(entity, key)):
+                changes[key] = (old, value)
+                setattr(entity, key, value)
 
 
 class EntityBase:
     entity_id: str
     home: Home
     bridge: str | None
+    changes: dict[str, tuple[Any, Any]]
 
 
 class NetatmoBase(EntityBase, ABC):
     """Base class for Netatmo entities."""
 
     def __init__(self, raw_data: RawData) -> None:
-        self.entity_id = raw_data["id"]
+        self.entity_id = sys.intern(raw_data["id"])
         self.name = raw_data.get("name", f"Unknown {self.entity_id}")
+        self.changes = {}
 
     def update_topology(self, raw_data: RawData) -> None:
         self._update_attributes(raw_data)
@@ -55,11 +104,31 @@ class NetatmoBase(EntityBase, ABC):
         ):
             self.name = f"{self.home.modules[self.bridge].name} {self.name}"
 
+    def attribute_names(self) -> AbstractSet[str]:
+        """Return the names of the instance attributes."""
+        return self.__dict__.keys()
+
     def _update_attributes(self, raw_data: RawData) -> None:
-        self.__dict__ = {
-            key: NETATMO_ATTRIBUTES_MAP.get(key, default(key, val))(raw_data, val)
-            for key, val in self.__dict__.items()
-        }
+        names = self.attribute_names()
+        updater = UPDATERS.get(cls := type(self))
+        if updater is None or updater.keys != names:
+            updater = UPDATERS[cls] = AttributeUpdater(names)
+        updater.apply(self, raw_data)
+
+    def record_changes(self, old: dict[str, Any]) -> None:
+        """Record the attributes which differ from their old values."""
+        changes = old.get("changes", {})
+        changes.update(
+            {
+                key: (old.get(key), val)
+                for key, val in self.__dict__.items()
+                if key != "changes" and old.get(key) != val
+            },
+        )
+        self.changes = changes
+
+
+UPDATERS: dict[type[NetatmoBase], AttributeUpdater] = {}
 
 
 @dataclass
@@ -89,6 +158,8 @@ class Place:
         data: dict[str, Any],
     ) -> None:
         if data is None:
+            self.altitude = self.city = self.country = self.timezone = None
+            self.location = None
             return
         self.altitude = data.get("altitude")
         self.city = data.get("city")
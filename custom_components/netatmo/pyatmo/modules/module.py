@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 import logging
+import sys
+import time
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, AbstractSet, Any, Dict
 
 from ..const import GETMEASURE_ENDPOINT, RawData
 from ..exceptions import ApiError
@@ -19,6 +21,9 @@ LOG = logging.getLogger(__name__)
 
 ModuleT = Dict[str, Any]
 
+# Seconds during which validated camera urls are not pinged again
+CAMERA_URL_TTL = 300
+
 # Hide from features list
 ATTRIBUTE_FILTER = {
     "battery_state",
@@ -38,6 +43,9 @@ ATTRIBUTE_FILTER = {
     "device_category",
     "device_type",
     "features",
+    "time_utc",
+    "changes",
+    "url_check",
 }
 
 
@@ -194,6 +202,12 @@ class PlaceMixin(EntityBase):
         self.place: Place | None = None
 
 
+class MeasureTimeMixin(EntityBase):
+    def __init__(self, home: Home, module: ModuleT):
+        super().__init__(home, module)  # type: ignore # mypy issue 4335
+        self.time_utc: int | None = None
+
+
 class DimmableMixin(EntityBase):
     def __init__(self, home: Home, module: ModuleT):
         super().__init__(home, module)  # type: ignore # mypy issue 4335
@@ -304,6 +318,7 @@ class CameraMixin(EntityBase):
         self.local_url: str | None = None
         self.is_local: bool | None = None
         self.alim_status: int | None = None
+        self.url_check: tuple[str | None, float] = (None, 0.0)
         self.device_type: DeviceType
 
     async def async_get_live_snapshot(self) -> bytes | None:
@@ -321,17 +336,25 @@ class CameraMixin(EntityBase):
 
         return resp
 
-    async def async_update_camera_urls(self) -> None:
-        """Update and validate the camera urls."""
-        if self.device_type == "NDB":
-            self.is_local = None
+    def camera_urls_expired(self, ttl: float = 0) -> bool:
+        """Return whether the camera urls need to be validated again."""
+        checked_url, checked_at = self.url_check
+        return bool(self.vpn_url and self.is_local) and (
+            checked_url != self.vpn_url or time.monotonic() - checked_at >= ttl
+        )
 
-        if self.vpn_url and self.is_local:
-            temp_local_url = await self._async_check_url(self.vpn_url)
-            if temp_local_url:
-                self.local_url = await self._async_check_url(
-                    temp_local_url,
-                )
+    async def async_update_camera_urls(self, ttl: float = 0) -> None:
+        """Update and validate the camera urls, unless validated within the ttl."""
+        if not self.camera_urls_expired(ttl):
+            return
+
+        # Failed checks are retried once the ttl expired as well
+        self.url_check = (self.vpn_url, time.monotonic())
+        temp_local_url = await self._async_check_url(self.vpn_url)
+        if temp_local_url:
+            self.local_url = await self._async_check_url(
+                temp_local_url,
+            )
 
     async def _async_check_url(self, url: str) -> str | None:
         """Validate camera url."""
@@ -491,6 +514,58 @@ class HistoryMixin(EntityBase):
             start_time = end_time
 
 
+def intern(value: str | None) -> str | None:
+    """Intern ids repeated across modules, rooms and events."""
+    return None if value is None else sys.intern(value)
+
+
+COMPACT_CLASSES: dict[type[Module], type[Module]] = {}
+
+# Feature sets are immutable and shared by all modules reporting the same ones
+NO_FEATURES: frozenset[str] = frozenset()
+FEATURE_SETS: dict[frozenset[str], frozenset[str]] = {NO_FEATURES: NO_FEATURES}
+
+
+def class_features(attributes: AbstractSet[str]) -> frozenset[str]:
+    """Return the features provided by the attributes of a module class."""
+    features = {var for var in attributes if var not in ATTRIBUTE_FILTER}
+    if "battery_state" in attributes or "battery_percent" in attributes:
+        features.add("battery")
+    if "wind_angle" in features:
+        features.add("wind_direction")
+        features.add("gust_direction")
+
+    frozen = frozenset(features)
+    return FEATURE_SETS.setdefault(frozen, frozen)
+
+
+def compact_class(cls: type[Module], home: Home, module: ModuleT) -> type[Module]:
+    """Return the slotted variant of a module class.
+
+    The slots are generated from the attributes set by the mixins of the
+    class, so instances do not need a per-instance __dict__. The features
+    of the class are derived from the same attributes.
+    """
+    if (compact := COMPACT_CLASSES.get(cls)) is None:
+        probe = object.__new__(cls)
+        cls.__init__(probe, home, module)
+        slots = tuple(vars(probe))
+        compact = COMPACT_CLASSES[cls] = type(
+            cls.__name__,
+            (cls,),
+            {
+                "__slots__": slots,
+                "__module__": cls.__module__,
+                "__qualname__": cls.__qualname__,
+                "_attribute_names": frozenset(slots),
+                "_features": class_features(frozenset(slots)),
+            },
+        )
+        COMPACT_CLASSES[compact] = compact
+
+    return compact
+
+
 class Module(NetatmoBase):
     """Class to represent a Netatmo module."""
 
@@ -500,18 +575,29 @@ class Module(NetatmoBase):
 
     modules: list[str] | None
     reachable: bool | None
-    features: set[str]
+    features: AbstractSet[str]
+
+    _attribute_names: frozenset[str] | None = None
+    _features: frozenset[str] | None = None
+
+    def __new__(cls, home: Home, module: ModuleT) -> Module:
+        return super().__new__(compact_class(cls, home, module))
 
     def __init__(self, home: Home, module: ModuleT) -> None:
         super().__init__(module)
         self.device_type = DeviceType(module["type"])
         self.home = home
-        self.room_id = module.get("room_id")
+        self.room_id = intern(module.get("room_id"))
         self.reachable = module.get("reachable")
-        self.bridge = module.get("bridge")
+        self.bridge = intern(module.get("bridge"))
         self.modules = module.get("modules_bridged")
         self.device_category = DEVICE_CATEGORY_MAP.get(self.device_type)
-        self.features = set()
+        self.features = NO_FEATURES
+
+    def attribute_names(self) -> AbstractSet[str]:
+        if self._attribute_names is not None:
+            return self._attribute_names
+        return super().attribute_names()
 
     async def update(self, raw_data: RawData) -> None:
         self.update_topology(raw_data)
@@ -526,12 +612,11 @@ class Module(NetatmoBase):
                     self.home.rooms[module.room_id].update(raw_data)
 
     def update_features(self) -> None:
-        self.features.update({var for var in vars(self) if var not in ATTRIBUTE_FILTER})
-        if "battery_state" in vars(self) or "battery_percent" in vars(self):
-            self.features.add("battery")
-        if "wind_angle" in self.features:
-            self.features.add("wind_direction")
-            self.features.add("gust_direction")
+        if (features := self._features) is None:
+            features = class_features(self.attribute_names())
+
+        if self.features is not features:
+            self.features = features
 
 
 # pylint: disable=too-many-ancestors
@@ -547,7 +632,9 @@ class Camera(
 ):
     async def update(self, raw_data: RawData) -> None:
         await Module.update(self, raw_data)
-        await self.async_update_camera_urls()
+        # Doorbells do not serve their urls locally
+        if self.device_type == "NDB":
+            self.is_local = None
 
 
 class Switch(FirmwareMixin, PowerMixin, SwitchMixin, Module):
@@ -27,6 +27,7 @@ from ..modules.module import (
     FloodlightMixin,
     HealthIndexMixin,
     HumidityMixin,
+    MeasureTimeMixin,
     Module,
     MonitoringMixin,
     NoiseMixin,
@@ -86,6 +87,7 @@ class NAMain(
     WifiMixin,
     FirmwareMixin,
     PlaceMixin,
+    MeasureTimeMixin,
     Module,
 ):
     ...
@@ -98,16 +100,33 @@ class NAModule1(
     FirmwareMixin,
     BatteryMixin,
     PlaceMixin,
+    MeasureTimeMixin,
     Module,
 ):
     ...
 
 
-class NAModule2(WindMixin, RfMixin, FirmwareMixin, BatteryMixin, PlaceMixin, Module):
+class NAModule2(
+    WindMixin,
+    RfMixin,
+    FirmwareMixin,
+    BatteryMixin,
+    PlaceMixin,
+    MeasureTimeMixin,
+    Module,
+):
     ...
 
 
-class NAModule3(RainMixin, RfMixin, FirmwareMixin, BatteryMixin, PlaceMixin, Module):
+class NAModule3(
+    RainMixin,
+    RfMixin,
+    FirmwareMixin,
+    BatteryMixin,
+    PlaceMixin,
+    MeasureTimeMixin,
+    Module,
+):
     ...
 
 
@@ -119,6 +138,7 @@ class NAModule4(
     FirmwareMixin,
     BatteryMixin,
     PlaceMixin,
+    MeasureTimeMixin,
     Module,
 ):
     ...
@@ -134,6 +154,7 @@ class NHC(
     WifiMixin,
     FirmwareMixin,
     PlaceMixin,
+    MeasureTimeMixin,
     Module,
 ):
     ...
@@ -0,0 +1,128 @@
+"""Support for the Netatmo API rate limits."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from enum import Enum
+from time import monotonic
+
+from .exceptions import RateLimitExceeded
+
+LOG = logging.getLogger(__name__)
+
+# Netatmo per user quotas as (requests, window in seconds)
+DEFAULT_RATE_LIMITS: list[tuple[int, int]] = [(50, 10), (500, 3600)]
+
+# Share of every quota window kept free for user initiated requests
+BACKGROUND_RESERVE = 0.2
+
+# Longest time a user initiated request waits for the budget to refill
+MAX_USER_WAIT = 10
+
+
+class RequestPriority(Enum):
+    """Request priority lanes."""
+
+    # temporarily disable locally-disabled and locally-enabled
+    # pylint: disable=C0103
+
+    USER = "user"
+    BACKGROUND = "background"
+
+    # pylint: enable=C0103
+
+
+class TokenBucket:
+    """Class to represent the request budget of a single quota window."""
+
+    def __init__(self, capacity: int, period: float) -> None:
+        self.capacity = capacity
+        self.period = period
+        self.rate = capacity / period
+        self._tokens = float(capacity)
+        self._updated = monotonic()
+
+    @property
+    def tokens(self) -> float:
+        """Return the currently available tokens."""
+        now = monotonic()
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated) * self.rate,
+        )
+        self._updated = now
+        return self._tokens
+
+    def consume(self) -> None:
+        """Take a token for one request."""
+        self._tokens = self.tokens - 1
+
+    def drain(self) -> None:
+        """Empty the bucket."""
+        self._tokens = min(self.tokens, 0.0)
+
+    def time_until(self, level: float) -> float:
+        """Return the seconds until the bucket holds the given level of tokens."""
+        return max(0.0, (level - self.tokens) / self.rate)
+
+
+class RateBudget:
+    """Class to keep track of the account wide API request budget."""
+
+    def __init__(
+        self,
+        limits: list[tuple[int, int]] | None = None,
+        reserve: float = BACKGROUND_RESERVE,
+        max_wait: float = MAX_USER_WAIT,
+    ) -> None:
+        self.buckets = [
+            TokenBucket(capacity, period)
+            for capacity, period in (limits or DEFAULT_RATE_LIMITS)
+        ]
+        self.reserve = reserve
+        self.max_wait = max_wait
+        self.granted: dict[RequestPriority, int] = {lane: 0 for lane in RequestPriority}
+        self.rejected: dict[RequestPriority, int] = {
+            lane: 0 for lane in RequestPriority
+        }
+        self._waiting = 0
+
+    @property
+    def remaining(self) -> float:
+        """Return the lowest remaining share of all quota windows."""
+        return min(bucket.tokens / bucket.capacity for bucket in self.buckets)
+
+    async def async_acquire(self, priority: RequestPriority) -> None:
+        """Take budget for one request or raise RateLimitExceeded."""
+        if priority is RequestPriority.USER:
+            await self._async_wait_for_budget()
+        elif self._waiting or any(
+            bucket.tokens < 1 + bucket.capacity * self.reserve
+            for bucket in self.buckets
+        ):
+            # Background requests yield to waiting and future user requests
+            self.rejected[priority] += 1
+            raise RateLimitExceeded("Request budget exhausted for background requests")
+
+        for bucket in self.buckets:
+            bucket.consume()
+        self.granted[priority] += 1
+
+    async def _async_wait_for_budget(self) -> None:
+        self._waiting += 1
+        try:
+            while (wait := max(bucket.time_until(1) for bucket in self.buckets)) > 0:
+                if wait > self.max_wait:
+                    self.rejected[RequestPriority.USER] += 1
+                    raise RateLimitExceeded(
+                        f"Request budget exhausted for the next {int(wait)}s"
+                    )
+                LOG.debug("Waiting %.1fs for request budget", wait)
+                await asyncio.sleep(wait)
+        finally:
+            self._waiting -= 1
+
+    def drain(self) -> None:
+        """Mark the budget as used up, e.g. after the API reported so."""
+        for bucket in self.buckets:
+            bucket.drain()
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any
 from .const import FROSTGUARD, HOME, MANUAL, SETROOMTHERMPOINT_ENDPOINT, RawData
 from .modules.base_class import NetatmoBase
 from .modules.device_types import DeviceType
+from .rate_limit import RequestPriority
 
 if TYPE_CHECKING:
     from .home import Home
@@ -78,12 +79,14 @@ class Room(NetatmoBase):
             self.features.add("humidity")
 
     def update(self, raw_data: RawData) -> None:
+        old = dict(self.__dict__)
         self.heating_power_request = raw_data.get("heating_power_request")
         self.humidity = raw_data.get("humidity")
         self.reachable = raw_data.get("reachable")
         self.therm_measured_temperature = raw_data.get("therm_measured_temperature")
         self.therm_setpoint_mode = raw_data.get("therm_setpoint_mode")
         self.therm_setpoint_temperature = raw_data.get("therm_setpoint_temperature")
+        self.record_changes(old)
 
     async def async_therm_manual(
         self,
@@ -165,4 +168,5 @@ class Room(NetatmoBase):
         await self.home.auth.async_post_api_request(
             endpoint=SETROOMTHERMPOINT_ENDPOINT,
             params=post_params,
+            priority=RequestPriority.USER,
         )
@@ -80,30 +80,15 @@ class NetatmoScheduleSelect(NetatmoBase, SelectEntity):
         """Entity created."""
         await super().async_added_to_hass()
 
-        self.data_handler.config_entry.async_on_unload(
-            async_dispatcher_connect(
-                self.hass,
-                f"signal-{DOMAIN}-webhook-{EVENT_TYPE_SCHEDULE}",
-                self.handle_event,
-            )
+        self.async_route_webhook_events(
+            self.handle_event, [EVENT_TYPE_SCHEDULE], self._home_id
         )
 
     @callback
     def handle_event(self, event: dict) -> None:
-        """Handle webhook events."""
-        data = event["data"]
-
-        if self._home_id != data["home_id"]:
-            return
-
-        if data["event_type"] == EVENT_TYPE_SCHEDULE and "schedule_id" in data:
-            self._attr_current_option = getattr(
-                self.hass.data[DOMAIN][DATA_SCHEDULES][self._home_id].get(
-                    data["schedule_id"]
-                ),
-                "name",
-            )
-            self.async_write_ha_state()
+        """Handle webhook events once the data handler patched the home."""
+        self.async_update_callback()
+        self.async_write_ha_state()
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
@@ -496,6 +496,7 @@ class NetatmoClimateBatterySensor(NetatmoBase, SensorEntity):
                 {
                     "name": HOME,
                     "home_id": netatmo_device.device.home.entity_id,
+                    "target_id": netatmo_device.device.entity_id,
                     SIGNAL_NAME: netatmo_device.signal_name,
                 },
             ]
@@ -547,6 +548,7 @@ class NetatmoSensor(NetatmoBase, SensorEntity):
                 {
                     "name": HOME,
                     "home_id": netatmo_device.device.home.entity_id,
+                    "target_id": netatmo_device.device.entity_id,
                     SIGNAL_NAME: netatmo_device.signal_name,
                 },
             ]
@@ -648,6 +650,7 @@ class NetatmoRoomSensor(NetatmoBase, SensorEntity):
                 {
                     "name": HOME,
                     "home_id": netatmo_room.room.home.entity_id,
+                    "target_id": netatmo_room.room.entity_id,
                     SIGNAL_NAME: netatmo_room.signal_name,
                 },
             ]
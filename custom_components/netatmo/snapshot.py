@@ -0,0 +1,174 @@
+"""Cache of Netatmo camera snapshots."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+import logging
+from time import monotonic
+
+from homeassistant.components.camera import Image
+from homeassistant.components.camera.img_util import scale_jpeg_camera_image
+from homeassistant.core import HomeAssistant
+
+from .pyatmo.helpers import image_type
+
+_LOGGER = logging.getLogger(__name__)
+
+SNAPSHOT_MAX_STALENESS = 300
+SNAPSHOT_VARIANT_BYTES = 4 * 1024 * 1024
+
+
+@dataclass
+class Snapshot:
+    """Class to hold a snapshot, its type and the time it was fetched."""
+
+    image: bytes
+    fetched: float
+    image_type: str | None
+
+
+class SnapshotCache:
+    """
+    Per camera cache of live snapshots.
+
+    Snapshots younger than the ttl are served from the cache. Older ones
+    are served while a refresh runs in the background, until they reach
+    the maximum staleness. Concurrent requests for a camera share one
+    download.
+
+    A ttl of zero disables the cache: every request downloads a new
+    snapshot, and is only shared with the download already running.
+
+    Snapshots scaled down to a requested size are kept per camera and size
+    in a LRU bounded by their total size in bytes.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        ttl: float,
+        max_staleness: float = SNAPSHOT_MAX_STALENESS,
+        max_variant_bytes: int = SNAPSHOT_VARIANT_BYTES,
+    ) -> None:
+        """Initialize self."""
+        self.hass = hass
+        self.ttl = ttl
+        self.max_staleness = max_staleness
+        self.max_variant_bytes = max_variant_bytes
+        self._snapshots: dict[str, Snapshot] = {}
+        self._in_flight: dict[str, asyncio.Task[Snapshot | None]] = {}
+        self._variants: OrderedDict[
+            tuple[str, int, int], tuple[float, bytes]
+        ] = OrderedDict()
+        self.variant_bytes = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.fetches = 0
+        self.fetch_time = 0.0
+        self.resizes = 0
+
+    @property
+    def average_latency(self) -> float | None:
+        """Return the average snapshot download time in seconds."""
+        return self.fetch_time / self.fetches if self.fetches else None
+
+    async def async_get(
+        self,
+        camera_id: str,
+        fetch: Callable[[], Awaitable[bytes | None]],
+        width: int | None = None,
+        height: int | None = None,
+    ) -> bytes | None:
+        """Return the snapshot of a camera, scaled down to fit the size if given."""
+        if (snapshot := await self._async_get_snapshot(camera_id, fetch)) is None:
+            return None
+
+        if not width or not height or snapshot.image_type != "jpeg":
+            return snapshot.image
+
+        return await self._async_get_variant(camera_id, snapshot, width, height)
+
+    async def _async_get_snapshot(
+        self, camera_id: str, fetch: Callable[[], Awaitable[bytes | None]]
+    ) -> Snapshot | None:
+        """Return the snapshot of a camera, fetching it if needed."""
+        if self.ttl > 0 and (snapshot := self._snapshots.get(camera_id)) is not None:
+            age = monotonic() - snapshot.fetched
+            if age < self.ttl:
+                self.hits += 1
+                return snapshot
+            if age < self.ttl + self.max_staleness:
+                self.stale_hits += 1
+                self._async_refresh(camera_id, fetch)
+                return snapshot
+
+        self.misses += 1
+        return await asyncio.shield(self._async_refresh(camera_id, fetch))
+
+    def _async_refresh(
+        self, camera_id: str, fetch: Callable[[], Awaitable[bytes | None]]
+    ) -> asyncio.Task[Snapshot | None]:
+        """Start a download unless one is already running for the camera."""
+        if (task := self._in_flight.get(camera_id)) is not None:
+            self.coalesced += 1
+            return task
+
+        task = self._in_flight[camera_id] = self.hass.async_create_task(
+            self._async_fetch(camera_id, fetch)
+        )
+        task.add_done_callback(lambda _: self._in_flight.pop(camera_id, None))
+        return task
+
+    async def _async_fetch(
+        self, camera_id: str, fetch: Callable[[], Awaitable[bytes | None]]
+    ) -> Snapshot | None:
+        start = monotonic()
+        image = await fetch()
+        self.fetches += 1
+        self.fetch_time += monotonic() - start
+
+        if image is None:
+            _LOGGER.debug("No snapshot received from camera %s", camera_id)
+            return None
+
+        snapshot = Snapshot(image, monotonic(), image_type(image))
+        if self.ttl > 0:
+            self._snapshots[camera_id] = snapshot
+        return snapshot
+
+    async def _async_get_variant(
+        self, camera_id: str, snapshot: Snapshot, width: int, height: int
+    ) -> bytes:
+        """Return a snapshot scaled down in the executor, or from the cache."""
+        key = (camera_id, width, height)
+        if (variant := self._variants.get(key)) is not None:
+            if variant[0] == snapshot.fetched:
+                self._variants.move_to_end(key)
+                return variant[1]
+            self._variants.pop(key)
+            self.variant_bytes -= len(variant[1])
+
+        image = await self.hass.async_add_executor_job(
+            scale_jpeg_camera_image,
+            Image("image/jpeg", snapshot.image),
+            width,
+            height,
+        )
+        self.resizes += 1
+
+        if (
+            self.ttl > 0
+            and key not in self._variants
+            and len(image) <= self.max_variant_bytes
+        ):
+            self._variants[key] = (snapshot.fetched, image)
+            self.variant_bytes += len(image)
+            while self.variant_bytes > self.max_variant_bytes:
+                _, (_, evicted) = self._variants.popitem(last=False)
+                self.variant_bytes -= len(evicted)
+
+        return image
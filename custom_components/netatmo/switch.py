@@ -63,6 +63,7 @@ class NetatmoSwitch(NetatmoBase, SwitchEntity):
                 {
                     "name": HOME,
                     "home_id": self._home_id,
+                    "target_id": self._id,
                     SIGNAL_NAME: self._signal_name,
                 },
             ]
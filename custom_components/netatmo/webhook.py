@@ -1,11 +1,15 @@
 """The Netatmo integration."""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
 import logging
+from time import time
 
 from aiohttp.web import Request
 
 from homeassistant.const import ATTR_DEVICE_ID, ATTR_ID, ATTR_NAME
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 
 from .const import (
     ATTR_EVENT_TYPE,
@@ -15,6 +19,8 @@ from .const import (
     ATTR_PERSONS,
     DATA_DEVICE_IDS,
     DATA_PERSONS,
+    DATA_WEBHOOK_QUEUE,
+    DATA_WEBHOOK_ROUTER,
     DEFAULT_PERSON,
     DOMAIN,
     EVENT_ID_MAP,
@@ -28,6 +34,254 @@ SUBEVENT_TYPE_MAP = {
     "therm_mode": "",
 }
 
+WEBHOOK_QUEUE_SIZE = 500
+WEBHOOK_DEDUPE_WINDOW = 60
+WEBHOOK_DRAIN_DELAY = 0.5
+
+
+def event_targets(data: dict) -> set[str]:
+    """Return the ids of the rooms and cameras a webhook event concerns."""
+    targets = {room["id"] for room in data.get("home", {}).get("rooms", [])}
+    if camera_id := data.get("camera_id"):
+        targets.add(camera_id)
+    return targets
+
+
+class WebhookRouter:
+    """
+    Route webhook events to the handlers of the objects they concern.
+
+    Handlers are keyed by event type, home id and room or camera id.
+    Handlers registered without an event type, home or target id get all
+    events, all events of their type, respectively all events of their
+    home. They are called in that order.
+
+    Batch handlers patch the model, so they get an event before the other
+    handlers. While the batch of a home is open, they get its events as one
+    list when the batch is finished. The handlers registered for the home
+    only read the model back, so they are called once after them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize self."""
+        self.routes: dict[
+            tuple[str | None, str | None, str | None], list[Callable[[dict], None]]
+        ] = {}
+        self.batch_routes: dict[
+            str | None, list[Callable[[str | None, list[dict]], None]]
+        ] = {}
+        self.event_types: dict[str | None, int] = {}
+        self._batch_home_id: str | None = None
+        self._batch: dict[
+            Callable[[str | None, list[dict]], None], list[dict]
+        ] | None = None
+        self._deferred: dict[Callable[[dict], None], dict] = {}
+        self.notified = 0
+
+    def _add_event_type(self, event_type: str | None) -> None:
+        self.event_types[event_type] = self.event_types.get(event_type, 0) + 1
+
+    def _remove_event_type(self, event_type: str | None) -> None:
+        self.event_types[event_type] -= 1
+        if not self.event_types[event_type]:
+            del self.event_types[event_type]
+
+    @callback
+    def async_register(
+        self,
+        event_type: str | None,
+        home_id: str | None,
+        target_id: str | None,
+        handler: Callable[[dict], None],
+    ) -> CALLBACK_TYPE:
+        """Register a handler and return a callback to unregister it."""
+        key = (event_type, home_id, target_id)
+        self.routes.setdefault(key, []).append(handler)
+        self._add_event_type(event_type)
+
+        @callback
+        def async_unregister() -> None:
+            handlers = self.routes[key]
+            handlers.remove(handler)
+            if not handlers:
+                del self.routes[key]
+            self._remove_event_type(event_type)
+
+        return async_unregister
+
+    @callback
+    def async_register_batch(
+        self,
+        event_type: str | None,
+        handler: Callable[[str | None, list[dict]], None],
+    ) -> CALLBACK_TYPE:
+        """Register a batch handler and return a callback to unregister it."""
+        self.batch_routes.setdefault(event_type, []).append(handler)
+        self._add_event_type(event_type)
+
+        @callback
+        def async_unregister() -> None:
+            handlers = self.batch_routes[event_type]
+            handlers.remove(handler)
+            if not handlers:
+                del self.batch_routes[event_type]
+            self._remove_event_type(event_type)
+
+        return async_unregister
+
+    @callback
+    def async_start_batch(self, home_id: str | None) -> None:
+        """Collect the events of a home until the batch is finished."""
+        self._batch_home_id = home_id
+        self._batch = {}
+
+    @callback
+    def async_finish_batch(self) -> None:
+        """Hand the collected events to the batch handlers, then notify once."""
+        home_id, batch, deferred = (
+            self._batch_home_id,
+            self._batch or {},
+            self._deferred,
+        )
+        self._batch, self._deferred = None, {}
+
+        for batch_handler, events in batch.items():
+            try:
+                batch_handler(home_id, events)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error handling webhook events of %s", home_id)
+
+        for handler, event in deferred.items():
+            try:
+                handler(event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error handling webhook event: %s", event)
+        self.notified += len(deferred)
+
+    @callback
+    def async_route(self, event_type: str, event: dict) -> None:
+        """Deliver an event to the handlers registered for it."""
+        if event_type not in self.event_types and None not in self.event_types:
+            return
+
+        data = event["data"]
+        home_id = data.get(ATTR_HOME_ID)
+
+        batch = self._batch if self._batch is not None else {}
+        for batch_key in (None, event_type):
+            for batch_handler in self.batch_routes.get(batch_key, ()):
+                batch.setdefault(batch_handler, []).append(event)
+        if self._batch is None:
+            for batch_handler, events in batch.items():
+                batch_handler(home_id, events)
+
+        keys = [
+            (None, None, None),
+            (event_type, None, None),
+            (event_type, home_id, None),
+        ]
+        keys.extend((event_type, home_id, target) for target in event_targets(data))
+
+        for key in keys:
+            for handler in tuple(self.routes.get(key, ())):
+                if self._batch is not None and key[1] is not None:
+                    # The last event wins, handlers read the patched model
+                    self._deferred[handler] = event
+                else:
+                    handler(event)
+                    self.notified += 1
+
+
+class WebhookIngestQueue:
+    """
+    Bounded queue between the webhook HTTP handler and event evaluation.
+
+    Events are deduplicated by event id within a time window, since
+    Netatmo retries deliveries. Queued events are drained after a short
+    delay so bursts are evaluated together: home by home, in arrival order
+    within a home, as one router batch per home. Events arriving while the
+    queue is full are dropped.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_size: int = WEBHOOK_QUEUE_SIZE,
+        dedupe_window: float = WEBHOOK_DEDUPE_WINDOW,
+        drain_delay: float = WEBHOOK_DRAIN_DELAY,
+    ) -> None:
+        """Initialize self."""
+        self.hass = hass
+        self.max_size = max_size
+        self.dedupe_window = dedupe_window
+        self.drain_delay = drain_delay
+        self._queue: deque[dict] = deque()
+        self._seen: dict[str, float] = {}
+        self._drain_scheduled = False
+        self.processed = 0
+        self.batches = 0
+        self.duplicates = 0
+        self.dropped = 0
+
+    @property
+    def depth(self) -> int:
+        """Return the number of queued events."""
+        return len(self._queue)
+
+    @callback
+    def async_put(self, data: dict) -> bool:
+        """Queue an event for evaluation and return whether it was accepted."""
+        now = time()
+
+        # Entries are in arrival order, so expired ones are at the front
+        while self._seen:
+            event_id = next(iter(self._seen))
+            if self._seen[event_id] > now - self.dedupe_window:
+                break
+            del self._seen[event_id]
+
+        if (event_id := data.get("event_id")) in self._seen:
+            self.duplicates += 1
+            return False
+
+        if len(self._queue) >= self.max_size:
+            self.dropped += 1
+            return False
+
+        if event_id is not None:
+            self._seen[event_id] = now
+
+        self._queue.append(data)
+
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            self.hass.loop.call_later(self.drain_delay, self._async_drain)
+
+        return True
+
+    @callback
+    def _async_drain(self) -> None:
+        """Evaluate the queued events home by home."""
+        self._drain_scheduled = False
+
+        homes: dict[str | None, list[dict]] = {}
+        while self._queue:
+            data = self._queue.popleft()
+            homes.setdefault(data.get(ATTR_HOME_ID), []).append(data)
+
+        router: WebhookRouter = self.hass.data[DOMAIN][DATA_WEBHOOK_ROUTER]
+        for home_id, events in homes.items():
+            router.async_start_batch(home_id)
+            for data in events:
+                try:
+                    async_process_webhook_data(self.hass, data)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error processing webhook data: %s", data)
+            router.async_finish_batch()
+
+            self.processed += len(events)
+            self.batches += 1
+
 
 async def async_handle_webhook(
     hass: HomeAssistant, webhook_id: str, request: Request
@@ -41,6 +295,13 @@ async def async_handle_webhook(
 
     _LOGGER.debug("Got webhook data: %s", data)
 
+    if not hass.data[DOMAIN][DATA_WEBHOOK_QUEUE].async_put(data):
+        _LOGGER.debug("Skipped webhook data: %s", data.get("event_id"))
+
+
+@callback
+def async_process_webhook_data(hass: HomeAssistant, data: dict) -> None:
+    """Evaluate the events of a webhook payload."""
     event_type = data.get(ATTR_EVENT_TYPE)
 
     if event_type in SUBEVENT_TYPE_MAP:
@@ -58,14 +319,15 @@ def async_evaluate_event(hass: HomeAssistant, event_data: dict) -> None:
     event_type = event_data.get(ATTR_EVENT_TYPE, "None")
 
     if event_type == "person":
+        persons = hass.data[DOMAIN][DATA_PERSONS][event_data[ATTR_HOME_ID]]
         for person in event_data.get(ATTR_PERSONS, {}):
-            person_event_data = dict(event_data)
-            person_event_data[ATTR_ID] = person.get(ATTR_ID)
-            person_event_data[ATTR_NAME] = hass.data[DOMAIN][DATA_PERSONS][
-                event_data[ATTR_HOME_ID]
-            ].get(person_event_data[ATTR_ID], DEFAULT_PERSON)
-            person_event_data[ATTR_IS_KNOWN] = person.get(ATTR_IS_KNOWN)
-            person_event_data[ATTR_FACE_URL] = person.get(ATTR_FACE_URL)
+            person_event_data = {
+                **event_data,
+                ATTR_ID: person.get(ATTR_ID),
+                ATTR_NAME: persons.get(person.get(ATTR_ID), DEFAULT_PERSON),
+                ATTR_IS_KNOWN: person.get(ATTR_IS_KNOWN),
+                ATTR_FACE_URL: person.get(ATTR_FACE_URL),
+            }
 
             async_send_event(hass, event_type, person_event_data)
 
@@ -76,10 +338,8 @@ def async_evaluate_event(hass: HomeAssistant, event_data: dict) -> None:
 def async_send_event(hass: HomeAssistant, event_type: str, data: dict) -> None:
     """Send events."""
     _LOGGER.debug("%s: %s", event_type, data)
-    async_dispatcher_send(
-        hass,
-        f"signal-{DOMAIN}-webhook-{event_type}",
-        {"type": event_type, "data": data},
+    hass.data[DOMAIN][DATA_WEBHOOK_ROUTER].async_route(
+        event_type, {"type": event_type, "data": data}
     )
 
     event_data = {